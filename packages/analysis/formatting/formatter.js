@@ -1,44 +1,133 @@
 require('dotenv').config();
 
 const Anthropic = require('@anthropic-ai/sdk');
-const { getFormattingPrompts } = require('./prompts/formatting-prompts');
+const { getFormattingPrompts, DEFAULT_ORG_CONTEXT } = require('./prompts/formatting-prompts');
 const { validateStructuredData } = require('./utils/validator');
+const { ResponseCache } = require('./utils/response-cache');
+const { FORMATTED_SECTIONS, PAGE_ANALYSIS_TOOL, OVERALL_SUMMARY_TOOL } = require('./prompts/formatting-schemas');
+
+// URL path keywords checked in order when inferring a page type
+const PAGE_TYPE_KEYWORDS = [
+  ['contact', 'Contact Page'],
+  ['about', 'About Page'],
+  ['training', 'Training Page'],
+  ['research', 'Research Page'],
+  ['project', 'Projects Page'],
+  ['cart', 'Cart Page']
+];
+// Upper-cased section titles as they appear in analysis headings, mapped to section names
+const SECTION_SCORE_KEYS = FORMATTED_SECTIONS.map(section => [section.title.toUpperCase(), section.name]);
+// Numbered section headings with their score, e.g. "## 2. Goal Alignment (Score: 7/10)"
+const SECTION_SCORE_REGEX = /##\s*\d+\.\s*([^(]+)\(Score:\s*(\d+)\/10\)/gi;
+const NAME_SEPARATOR_REGEX = /[-_]/g;
+const WORD_START_REGEX = /\b\w/g;
+// Line patterns for the plain-text list fallbacks
+const LIST_ITEM_REGEX = /^(?:[-*•\d]\s|\d+\.\s)/;
+const LIST_ITEM_PREFIX_REGEX = /^[-*•\d\.]\s*/;
+const LIST_BLOCK_END_REGEX = /^(##|SUMMARY:|PAGE ROLE ANALYSIS:)/i;
+const HOW_TO_FIX_REGEX = /(.*?)\s*How to Fix:\s*(.*)/i;
+const BENEFIT_REGEX = /(.*?)\s*Benefit:\s*(.*)/i;
+// Compiled heading regex and item kind per keyword list; the call sites use a handful of fixed lists
+const listFallbackSpecs = new Map();
+
+function toTitleCase(name) {
+  return name.replace(NAME_SEPARATOR_REGEX, ' ').replace(WORD_START_REGEX, l => l.toUpperCase());
+}
+
+/**
+ * Get the heading regex and item kind for a list fallback keyword list, building them on first use
+ * @param {string[]} keywords - Block heading keywords
+ * @returns {{keywordRegex: RegExp, isIssueList: boolean, isRecommendationList: boolean}}
+ */
+function getListFallbackSpec(keywords) {
+  const cacheKey = keywords.join('|');
+  let spec = listFallbackSpecs.get(cacheKey);
+  if (!spec) {
+    const lowerKeywords = keywords.map(k => k.toLowerCase());
+    spec = {
+      keywordRegex: new RegExp(`(?:${cacheKey}):`, 'i'),
+      isIssueList: lowerKeywords.some(k => k.includes('issue') || k.includes('flaw')),
+      isRecommendationList: lowerKeywords.some(k => k.includes('recommendation'))
+    };
+    listFallbackSpecs.set(cacheKey, spec);
+  }
+  return spec;
+}
 
 class Formatter {
   constructor(options = {}) {
     this.model = options.model || process.env.ANTHROPIC_MODEL || 'claude-3-7-sonnet-20250219';
     this.concurrency = options.concurrency || 4;
-    this.orgContext = options.orgContext || { // Added orgContext initialization
-      org_name: 'the organization',
-      org_type: 'organization',
-      org_purpose: 'to achieve its business goals and serve its users effectively'
-    };
+    this.orgContext = options.orgContext || DEFAULT_ORG_CONTEXT;
+
+    // The prompt builders only close over orgContext, so create them once
+    this.prompts = getFormattingPrompts(this.orgContext);
+
+    // Identical prompts (e.g. re-running on unchanged analysis) reuse earlier responses unless disabled
+    this.responseCache = options.useResponseCache === false ? null : new ResponseCache({ cacheDir: options.cacheDir });
 
     this.client = new Anthropic({
       apiKey: process.env.ANTHROPIC_API_KEY,
     });
   }
 
+  /**
+   * Forces the model to answer through a tool and returns the tool input object,
+   * reusing a cached response for an identical request. The API has already parsed the input, so a fresh response skips JSON parsing
+   * entirely; a cached one is parsed once. Falls back to parseJSON if the model
+   * replies with text instead, and throws if the tool input was cut off so the
+   * caller's fallback runs and nothing incomplete is cached.
+   * @param {string} prompt - Prompt text
+   * @param {number} maxTokens - Maximum tokens to generate
+   * @param {Object} tool - Anthropic tool definition whose input_schema shapes the response
+   * @param {string} source - Label used in log messages and fallback extraction
+   * @returns {Promise<Object>} Structured response
+   */
+  async createStructuredCompletion(prompt, maxTokens, tool, source) {
+    // The schema is part of the key so schema edits do not replay responses shaped by the old one
+    const cacheKey = ResponseCache.createKey(this.model, maxTokens, tool.name, JSON.stringify(tool.input_schema), prompt);
+    const cached = this.responseCache ? await this.responseCache.get(cacheKey) : null;
+    if (cached !== null) {
+      console.log(`     ♻️  Reusing cached LLM response for ${source}`);
+      return JSON.parse(cached);
+    }
+
+    const response = await this.client.messages.create({
+      model: this.model,
+      max_tokens: maxTokens,
+      messages: [{ role: 'user', content: prompt }],
+      tools: [tool],
+      tool_choice: { type: 'tool', name: tool.name }
+    });
+
+    const toolUse = response.content.find(block => block.type === 'tool_use');
+    if (!toolUse) {
+      const textBlock = response.content.find(block => block.type === 'text');
+      return this.parseJSON(textBlock ? textBlock.text : '', source);
+    }
+
+    // A response cut off at max_tokens carries partial tool input; never cache it
+    if (response.stop_reason !== 'tool_use') {
+      console.warn(`     ⚠️  Structured response for ${source} ended with stop_reason '${response.stop_reason}', not caching it`);
+      throw new Error(`Incomplete structured response for ${source} (stop_reason: ${response.stop_reason})`);
+    }
+
+    console.log(`     ✅ Received structured response for ${source}`);
+    if (this.responseCache) {
+      await this.responseCache.set(cacheKey, JSON.stringify(toolUse.input));
+    }
+    return toolUse.input;
+  }
+
   extractSectionScores(analysisText) {
     const scores = {};
     if (!analysisText || typeof analysisText !== 'string') {
       return scores;
     }
-    const sectionMappings = {
-      'FIRST IMPRESSION & CLARITY': 'first_impression_clarity',
-      'GOAL ALIGNMENT': 'goal_alignment',
-      'VISUAL DESIGN': 'visual_design',
-      'CONTENT QUALITY': 'content_quality',
-      'USABILITY & ACCESSIBILITY': 'usability_accessibility',
-      'CONVERSION OPTIMIZATION': 'conversion_optimization',
-      'TECHNICAL EXECUTION': 'technical_execution'
-    };
-    const scoreRegex = /##\s*\d+\.\s*([^(]+)\(Score:\s*(\d+)\/10\)/gi;
-    let match;
-    while ((match = scoreRegex.exec(analysisText)) !== null) {
+    for (const match of analysisText.matchAll(SECTION_SCORE_REGEX)) {
       const sectionNameFull = match[1].trim().toUpperCase();
       const score = parseInt(match[2], 10);
-      for (const [key, value] of Object.entries(sectionMappings)) {
+      for (const [key, value] of SECTION_SCORE_KEYS) {
         if (sectionNameFull.includes(key)) {
           scores[value] = score;
           break;
@@ -48,44 +137,55 @@ class Formatter {
     return scores;
   }
 
-  extractListFallback(text, keywords) {
-    const items = [];
-    if (!text || typeof text !== 'string') return items;
-    const lines = text.split('\n');
-    let inRelevantBlock = !keywords.length;
-    const keywordRegex = new RegExp(`(?:${keywords.join('|')}):`, 'i');
-
-    for (const line of lines) {
+  /**
+   * Extract several keyword-headed lists in a single pass over the text
+   * @param {string} text - Plain-text analysis
+   * @param {string[][]} keywordLists - Block heading keywords for each list
+   * @returns {Array<Array<string|Object>>} Items for each keyword list, in the same order
+   */
+  extractListsFallback(text, keywordLists) {
+    const results = keywordLists.map(() => []);
+    if (!text || typeof text !== 'string') return results;
+    const lists = keywordLists.map((keywords, index) => ({
+      ...getListFallbackSpec(keywords),
+      hasKeywords: keywords.length > 0,
+      inRelevantBlock: !keywords.length,
+      items: results[index]
+    }));
+
+    for (const line of text.split('\n')) {
         const trimmedLine = line.trim();
-        if (keywords.length && keywordRegex.test(trimmedLine)) {
-            inRelevantBlock = true;
-            continue;
-        }
-        if (inRelevantBlock) {
-            if (trimmedLine.match(/^[-*•\d]\s/) || trimmedLine.match(/^\d+\.\s/)) {
-                let itemText = trimmedLine.replace(/^[-*•\d\.]\s*/, '').trim();
-                const fixMatch = itemText.match(/(.*?)\s*How to Fix:\s*(.*)/i);
-                const benefitMatch = itemText.match(/(.*?)\s*Benefit:\s*(.*)/i);
-
-                if (keywords.some(k => k.toLowerCase().includes('issue') || k.toLowerCase().includes('flaw')) && fixMatch) {
-                    items.push({ issue: fixMatch[1].trim(), how_to_fix: fixMatch[2].trim() });
-                } else if (keywords.some(k => k.toLowerCase().includes('recommendation')) && benefitMatch) {
-                     items.push({ recommendation: benefitMatch[1].trim(), benefit: benefitMatch[2].trim() });
+        const isListItem = LIST_ITEM_REGEX.test(trimmedLine);
+        const itemText = isListItem ? trimmedLine.replace(LIST_ITEM_PREFIX_REGEX, '').trim() : null;
+        const isBlockEnd = !isListItem && LIST_BLOCK_END_REGEX.test(trimmedLine);
+
+        for (const list of lists) {
+            if (list.hasKeywords && list.keywordRegex.test(trimmedLine)) {
+                list.inRelevantBlock = true;
+                continue;
+            }
+            if (!list.inRelevantBlock) continue;
+            if (isListItem) {
+                const fixMatch = list.isIssueList && itemText.match(HOW_TO_FIX_REGEX);
+                const benefitMatch = list.isRecommendationList && itemText.match(BENEFIT_REGEX);
+
+                if (fixMatch) {
+                    list.items.push({ issue: fixMatch[1].trim(), how_to_fix: fixMatch[2].trim() });
+                } else if (benefitMatch) {
+                    list.items.push({ recommendation: benefitMatch[1].trim(), benefit: benefitMatch[2].trim() });
+                } else if (list.isIssueList) {
+                    list.items.push({ issue: itemText, how_to_fix: "Details not parsed." });
+                } else if (list.isRecommendationList) {
+                    list.items.push({ recommendation: itemText, benefit: "Details not parsed." });
                 } else {
-                    if (keywords.some(k => k.toLowerCase().includes('issue') || k.toLowerCase().includes('flaw'))) {
-                        items.push({ issue: itemText, how_to_fix: "Details not parsed." });
-                    } else if (keywords.some(k => k.toLowerCase().includes('recommendation'))) {
-                         items.push({ recommendation: itemText, benefit: "Details not parsed." });
-                    } else {
-                         items.push(itemText);
-                    }
+                    list.items.push(itemText);
                 }
-            } else if (trimmedLine.match(/^(##|SUMMARY:|PAGE ROLE ANALYSIS:)/i) && keywords.length) {
-                 inRelevantBlock = false;
+            } else if (isBlockEnd && list.hasKeywords) {
+                list.inRelevantBlock = false;
             }
         }
     }
-    return items.filter(item => (typeof item === 'string' && item.length > 5) || (typeof item === 'object' && item !== null));
+    return results.map(items => items.filter(item => (typeof item === 'string' && item.length > 5) || (typeof item === 'object' && item !== null)));
   }
 
   extractScoreFallback(text) {
@@ -118,21 +218,19 @@ class Formatter {
     if (!url || typeof url !== 'string') return 'Page';
     try {
       const saneUrl = !url.startsWith('http') ? `https://${url}` : url;
-      const path = new URL(saneUrl).pathname.toLowerCase();
-      if (path === '/' || path === '' || path.includes('index') || path.endsWith(new URL(saneUrl).hostname)) return 'Homepage';
-      if (path.includes('contact')) return 'Contact Page';
-      if (path.includes('about')) return 'About Page';
-      if (path.includes('training')) return 'Training Page';
-      if (path.includes('research')) return 'Research Page';
-      if (path.includes('project')) return 'Projects Page';
-      if (path.includes('cart')) return 'Cart Page';
+      const urlObj = new URL(saneUrl);
+      const path = urlObj.pathname.toLowerCase();
+      if (path === '/' || path === '' || path.includes('index') || path.endsWith(urlObj.hostname)) return 'Homepage';
+      for (const [keyword, pageType] of PAGE_TYPE_KEYWORDS) {
+        if (path.includes(keyword)) return pageType;
+      }
       const parts = path.split('/').filter(Boolean);
       const lastPart = parts.pop() || 'generic';
-      return lastPart.replace(/[-_]/g, ' ').replace(/\b\w/g, l => l.toUpperCase()) + ' Page';
+      return toTitleCase(lastPart) + ' Page';
     } catch (e) {
       const pathSegment = url.substring(url.lastIndexOf('/') + 1);
       const simpleName = pathSegment.split('.')[0];
-      return simpleName.replace(/[-_]/g, ' ').replace(/\b\w/g, l => l.toUpperCase()) || 'Page';
+      return toTitleCase(simpleName) || 'Page';
     }
   }
 
@@ -153,26 +251,36 @@ class Formatter {
       const parsed = JSON.parse(cleanedText);
       console.log(`     ✅ Successfully parsed JSON for ${source}`);
       return parsed;
-    } catch (e) { /* continue to next attempt */ }
+    } catch (e) {
+      if (!(e instanceof SyntaxError)) throw e;
+    }
 
     const codeBlockMatch = cleanedText.match(/```(?:json)?\s*([\s\S]*?)\s*```/);
-    if (codeBlockMatch && codeBlockMatch[1]) {
+    const codeBlockJson = codeBlockMatch && codeBlockMatch[1] ? codeBlockMatch[1].trim() : null;
+    if (codeBlockJson && codeBlockJson !== cleanedText) {
       try {
-        const parsed = JSON.parse(codeBlockMatch[1].trim());
+        const parsed = JSON.parse(codeBlockJson);
         console.log(`     ✅ Successfully parsed JSON from code block for ${source}`);
         return parsed;
-      } catch (e) { /* continue to next attempt */ }
+      } catch (e) {
+        if (!(e instanceof SyntaxError)) throw e;
+      }
     }
 
+    // Skip candidates identical to one that has already failed to parse
     const firstBrace = cleanedText.indexOf('{');
     const lastBrace = cleanedText.lastIndexOf('}');
     if (firstBrace !== -1 && lastBrace > firstBrace) {
       const potentialJson = cleanedText.substring(firstBrace, lastBrace + 1);
-      try {
-        const parsed = JSON.parse(potentialJson);
-        console.log(`     ✅ Successfully extracted and parsed JSON object for ${source}`);
-        return parsed;
-      } catch (e) { /* continue to fallback */ }
+      if (potentialJson !== cleanedText && potentialJson !== codeBlockJson) {
+        try {
+          const parsed = JSON.parse(potentialJson);
+          console.log(`     ✅ Successfully extracted and parsed JSON object for ${source}`);
+          return parsed;
+        } catch (e) {
+          if (!(e instanceof SyntaxError)) throw e;
+        }
+      }
     }
 
     console.warn(`     ⚠️  JSON parse failed for ${source}, using text extraction fallback.`);
@@ -185,47 +293,36 @@ class Formatter {
 
   extractOverallSummaryFromTextFallback(text) {
     console.log('     📝 Using text extraction fallback for overall summary');
-
-    const jsonMatch = text.match(/\{[\s\S]*\}/);
-    if (jsonMatch) {
-      try {
-        const nestedData = JSON.parse(jsonMatch[0]);
-        console.log('     🔍 Found nested JSON in LLM response');
-        return {
-          executive_summary: nestedData.executive_summary || this.extractSummaryFallback(text, 500) || 'Website analysis summary requires review.',
-          overall_score: nestedData.overall_score || this.extractScoreFallback(text) || 5,
-          site_score_explanation: nestedData.site_score_explanation || "Overall site score explanation requires manual review.",
-          total_pages_analyzed: nestedData.total_pages_analyzed || 0,
-          most_critical_issues: Array.isArray(nestedData.most_critical_issues) ? nestedData.most_critical_issues.map(String) : this.extractListFallback(text, ['critical_issues', 'site-wide critical issue']).map(item => typeof item === 'object' ? item.issue : String(item)).slice(0, 5),
-          top_recommendations: Array.isArray(nestedData.top_recommendations) ? nestedData.top_recommendations.map(String) : this.extractListFallback(text, ['top_recommendations', 'priority recommendation']).map(item => typeof item === 'object' ? item.recommendation : String(item)).slice(0, 5),
-          key_strengths: Array.isArray(nestedData.key_strengths) ? nestedData.key_strengths.map(String) : this.extractListFallback(text, ['key_strengths', 'website does well']).map(item => String(item)).slice(0, 3),
-          performance_summary: nestedData.performance_summary || this.extractSectionTextFallback(text, 'performance_summary') || 'Performance details require review.',
-          detailed_markdown_content: nestedData.detailed_markdown_content || text // THIS IS THE KEY LINE FOR THE BUG
-        };
-      } catch (e) {
-        console.warn('     ⚠️ Failed to parse nested JSON, using manual extraction for overall summary fallback');
-      }
-    }
+    const [criticalIssues, topRecommendations, keyStrengths] = this.extractListsFallback(text, [
+      ['critical_issues', 'site-wide critical issue'],
+      ['top_recommendations', 'priority recommendation'],
+      ['key_strengths', 'website does well']
+    ]);
 
     return {
       executive_summary: this.extractSummaryFallback(text, 500) || 'Website analysis summary requires review.',
       overall_score: this.extractScoreFallback(text) || 5,
       site_score_explanation: "Overall site score explanation requires manual review.",
       total_pages_analyzed: 0,
-      most_critical_issues: this.extractListFallback(text, ['critical_issues', 'site-wide critical issue']).map(item => typeof item === 'object' ? item.issue : String(item)).slice(0, 5),
-      top_recommendations: this.extractListFallback(text, ['top_recommendations', 'priority recommendation']).map(item => typeof item === 'object' ? item.recommendation : String(item)).slice(0, 5),
-      key_strengths: this.extractListFallback(text, ['key_strengths', 'website does well']).map(item => String(item)).slice(0, 3),
+      most_critical_issues: criticalIssues.map(item => typeof item === 'object' ? item.issue : String(item)).slice(0, 5),
+      top_recommendations: topRecommendations.map(item => typeof item === 'object' ? item.recommendation : String(item)).slice(0, 5),
+      key_strengths: keyStrengths.map(item => String(item)).slice(0, 3),
       performance_summary: this.extractSectionTextFallback(text, 'performance_summary') || 'Performance details require review.',
       detailed_markdown_content: text
     };
   }
 
   extractPageDataFromTextFallback(analysisText, url) {
-    const key_issue_objects = this.extractListFallback(analysisText, ['CRITICAL FLAWS', 'issues', 'problems', 'flaws']).slice(0, 8);
-    const recommendation_objects = this.extractListFallback(analysisText, ['ACTIONABLE RECOMMENDATIONS', 'recommendations', 'suggestions', 'improvements']).slice(0, 8);
+    const [issueItems, recommendationItems] = this.extractListsFallback(analysisText, [
+      ['CRITICAL FLAWS', 'issues', 'problems', 'flaws'],
+      ['ACTIONABLE RECOMMENDATIONS', 'recommendations', 'suggestions', 'improvements']
+    ]);
+    const key_issue_objects = issueItems.slice(0, 8);
+    const recommendation_objects = recommendationItems.slice(0, 8);
+    const pageType = this.extractPageType(url);
     return {
-      page_type: this.extractPageType(url),
-      title: this.extractPageType(url) || "Untitled Page (Fallback)",
+      page_type: pageType,
+      title: pageType || "Untitled Page (Fallback)",
       overall_score: this.extractScoreFallback(analysisText) || 3,
       overall_explanation: this.extractOverallExplanationFallback(analysisText) || "Detailed explanation requires manual review.",
       sections: [],
@@ -313,16 +410,10 @@ class Formatter {
       return this.createFallbackPageAnalysis(pageAnalysisItem || {url: `Unknown URL ${index}`, analysis: ""}, index);
     }
     console.log(`     📄 [${index}] Formatting: ${pageAnalysisItem.url}`);
-    const prompt = getFormattingPrompts(this.orgContext).individualPage(pageAnalysisItem); // Pass orgContext
+    const prompt = this.prompts.individualPage(pageAnalysisItem);
     let parsed;
     try {
-      const response = await this.client.messages.create({
-        model: this.model,
-        max_tokens: 4000,
-        messages: [{ role: 'user', content: prompt }]
-      });
-      const formattedText = response.content[0].text.trim();
-      parsed = this.parseJSON(formattedText, pageAnalysisItem.url);
+      parsed = await this.createStructuredCompletion(prompt, 4000, PAGE_ANALYSIS_TOOL, pageAnalysisItem.url);
     } catch (error) {
       console.error(`     ❌ LLM call or initial parsing failed for ${pageAnalysisItem.url}:`, error.message);
       parsed = this.extractPageDataFromTextFallback(pageAnalysisItem.analysis, pageAnalysisItem.url);
@@ -374,17 +465,10 @@ class Formatter {
     const overviewContent = (rawAnalysisData && typeof rawAnalysisData.overview === 'string') ? rawAnalysisData.overview : "Comprehensive overview not available.";
     const promptRawData = { ...rawAnalysisData, overview: overviewContent };
 
-    const prompt = getFormattingPrompts(this.orgContext).overallSummary(promptRawData, formattedPageAnalyses); // Pass orgContext
+    const prompt = this.prompts.overallSummary(promptRawData, formattedPageAnalyses);
     let parsedSummary;
     try {
-      const response = await this.client.messages.create({
-        model: this.model,
-        max_tokens: 4096,
-        messages: [{ role: 'user', content: prompt }]
-      });
-      const summaryText = response.content[0].text.trim();
-      console.log(`     📝 LLM response length for overall summary: ${summaryText.length} characters`);
-      parsedSummary = this.parseJSON(summaryText, 'overall summary');
+      parsedSummary = await this.createStructuredCompletion(prompt, 4096, OVERALL_SUMMARY_TOOL, 'overall summary');
 
       // --- UPDATED FIX APPLICATION ---
       // Ensure detailed_markdown_content is the raw overviewContent from the analysis stage.
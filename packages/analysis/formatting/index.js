@@ -1,12 +1,18 @@
 const fs = require('fs-extra');
 const path = require('path');
 const { Formatter } = require('./formatter');
+const { DEFAULT_ORG_CONTEXT } = require('./prompts/formatting-prompts');
 
 class FormattingService {
   constructor(options = {}) {
     this.model = options.model || 'claude-3-7-sonnet-20250219';
     this.inputPath = options.inputPath || './data/analysis/analysis.json';
     this.outputPath = options.outputPath || './data/analysis/structured-analysis.json';
+    // Identical formatting prompts reuse earlier LLM responses for up to 7 days, also across
+    // reruns. Pass useResponseCache: false or set LLM_RESPONSE_CACHE=0 to always ask the model again.
+    this.useResponseCache = options.useResponseCache ??
+      !['0', 'false', 'no', 'off'].includes(String(process.env.LLM_RESPONSE_CACHE || '').toLowerCase());
+    this.cacheDir = options.cacheDir || path.join(path.dirname(this.outputPath), '.llm-response-cache');
     
     // Organization context - can be overridden via options
     this.orgContext = options.orgContext || null; // Will be extracted from analysis data if not provided
@@ -17,6 +23,7 @@ class FormattingService {
     console.log(`📥 Input: ${this.inputPath}`);
     console.log(`📤 Output: ${this.outputPath}`);
     console.log(`🧠 Model: ${this.model}`);
+    console.log(`♻️  Response cache: ${this.useResponseCache ? this.cacheDir : 'disabled'}`);
     
     const startTime = Date.now();
     
@@ -33,7 +40,9 @@ class FormattingService {
       
       // Read raw analysis data
       console.log('\n📖 Reading raw analysis data...');
-      const rawAnalysisData = await fs.readJson(this.inputPath);
+      // Strip a UTF-8 BOM like fs.readJson does, since JSON.parse rejects it
+      const rawAnalysisJson = (await fs.readFile(this.inputPath, 'utf8')).replace(/^\uFEFF/, '');
+      const rawAnalysisData = JSON.parse(rawAnalysisJson);
       
       // Check if we have meaningful data
       if (!rawAnalysisData || typeof rawAnalysisData !== 'object') {
@@ -43,11 +52,7 @@ class FormattingService {
       console.log(`   ✅ Loaded analysis data (${Object.keys(rawAnalysisData).length} top-level keys)`);
       
       // Extract organization context from analysis data if not provided
-      const orgContext = this.orgContext || rawAnalysisData.orgContext || {
-        org_name: 'the organization',
-        org_type: 'organization', 
-        org_purpose: 'to achieve its business goals and serve its users effectively'
-      };
+      const orgContext = this.orgContext || rawAnalysisData.orgContext || DEFAULT_ORG_CONTEXT;
       
       console.log(`🏢 Organization: ${orgContext.org_name} (${orgContext.org_type})`);
       console.log(`🎯 Purpose: ${orgContext.org_purpose}`);
@@ -55,7 +60,9 @@ class FormattingService {
       // Initialize formatter with organization context
       const formatter = new Formatter({
         model: this.model,
-        orgContext: orgContext
+        orgContext: orgContext,
+        useResponseCache: this.useResponseCache,
+        cacheDir: this.cacheDir
       });
       
       // Format the data
@@ -69,8 +76,9 @@ class FormattingService {
         // Ensure output directory exists
         await fs.ensureDir(path.dirname(this.outputPath));
         
-        // Save formatted data
-        await fs.writeJson(this.outputPath, result.data, { spaces: 2 });
+        // Save formatted data (serialized once, reused for the size stats)
+        const outputJson = JSON.stringify(result.data, null, 2);
+        await fs.writeFile(this.outputPath, outputJson + '\n');
         
         const duration = (Date.now() - startTime) / 1000;
         
@@ -83,8 +91,8 @@ class FormattingService {
           data: result.data,
           stats: {
             duration: duration,
-            inputSize: JSON.stringify(rawAnalysisData).length,
-            outputSize: JSON.stringify(result.data).length
+            inputSize: rawAnalysisJson.length,
+            outputSize: outputJson.length
           },
           files: {
             input: this.inputPath,
@@ -0,0 +1,108 @@
+/**
+ * JSON schemas for the formatting stage. They are sent to the model as tool
+ * input schemas so the response comes back as structured input rather than
+ * free text that has to be parsed.
+ */
+
+// Sections of a formatted page analysis, in report order. The prompt, the schema
+// and the formatter's score extraction all derive from this list.
+const FORMATTED_SECTIONS = Object.freeze([
+  { name: 'first_impression_clarity', title: 'First Impression & Clarity' },
+  { name: 'goal_alignment', title: 'Goal Alignment' },
+  { name: 'visual_design', title: 'Visual Design' },
+  { name: 'content_quality', title: 'Content Quality' },
+  { name: 'usability_accessibility', title: 'Usability & Accessibility' },
+  { name: 'conversion_optimization', title: 'Conversion Optimization' },
+  { name: 'technical_execution', title: 'Technical Execution' }
+]);
+
+const SCORE = { type: 'number', minimum: 1, maximum: 10 };
+
+const PAGE_ANALYSIS_SCHEMA = {
+  type: 'object',
+  properties: {
+    page_type: { type: 'string' },
+    title: { type: 'string' },
+    overall_score: SCORE,
+    overall_explanation: { type: 'string' },
+    sections: {
+      type: 'array',
+      items: {
+        type: 'object',
+        properties: {
+          name: { type: 'string', enum: FORMATTED_SECTIONS.map(section => section.name) },
+          title: { type: 'string' },
+          score: SCORE,
+          summary: { type: 'string' },
+          points: { type: 'array', items: { type: 'string' } },
+          evidence: { type: 'string' },
+          score_explanation: { type: 'string' }
+        },
+        required: ['name', 'title', 'score', 'summary', 'points', 'evidence', 'score_explanation']
+      }
+    },
+    key_issues: {
+      type: 'array',
+      maxItems: 8,
+      items: {
+        type: 'object',
+        properties: {
+          issue: { type: 'string' },
+          how_to_fix: { type: 'string' }
+        },
+        required: ['issue', 'how_to_fix']
+      }
+    },
+    recommendations: {
+      type: 'array',
+      maxItems: 8,
+      items: {
+        type: 'object',
+        properties: {
+          recommendation: { type: 'string' },
+          benefit: { type: 'string' }
+        },
+        required: ['recommendation', 'benefit']
+      }
+    },
+    summary: { type: 'string' }
+  },
+  required: ['page_type', 'title', 'overall_score', 'overall_explanation', 'sections', 'key_issues', 'recommendations', 'summary']
+};
+
+const OVERALL_SUMMARY_SCHEMA = {
+  type: 'object',
+  properties: {
+    executive_summary: { type: 'string' },
+    overall_score: SCORE,
+    site_score_explanation: { type: 'string' },
+    total_pages_analyzed: { type: 'integer' },
+    most_critical_issues: { type: 'array', maxItems: 5, items: { type: 'string' } },
+    top_recommendations: { type: 'array', maxItems: 5, items: { type: 'string' } },
+    key_strengths: { type: 'array', maxItems: 3, items: { type: 'string' } },
+    performance_summary: { type: 'string' },
+    detailed_markdown_content: { type: 'string' }
+  },
+  required: ['executive_summary', 'overall_score', 'site_score_explanation', 'most_critical_issues', 'top_recommendations', 'key_strengths', 'performance_summary']
+};
+
+// Anthropic tool definitions; forcing the tool makes the model answer with schema-shaped input
+const PAGE_ANALYSIS_TOOL = {
+  name: 'record_page_analysis',
+  description: 'Record the structured analysis of a single page.',
+  input_schema: PAGE_ANALYSIS_SCHEMA
+};
+
+const OVERALL_SUMMARY_TOOL = {
+  name: 'record_overall_summary',
+  description: 'Record the structured overall summary of the website.',
+  input_schema: OVERALL_SUMMARY_SCHEMA
+};
+
+module.exports = {
+  FORMATTED_SECTIONS,
+  PAGE_ANALYSIS_SCHEMA,
+  OVERALL_SUMMARY_SCHEMA,
+  PAGE_ANALYSIS_TOOL,
+  OVERALL_SUMMARY_TOOL
+};
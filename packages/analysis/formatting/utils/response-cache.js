@@ -0,0 +1,93 @@
+const fs = require('fs-extra');
+const path = require('path');
+const crypto = require('crypto');
+
+const DEFAULT_MAX_ENTRIES = 1024;
+const DEFAULT_TTL_MS = 7 * 24 * 60 * 60 * 1000; // 7 days
+
+/**
+ * Content-addressed cache of LLM responses. Entries live in a bounded in-memory
+ * LRU and, when a cache directory is given, on disk so reruns can reuse them.
+ */
+class ResponseCache {
+  constructor(options = {}) {
+    this.cacheDir = options.cacheDir || null;
+    this.maxEntries = options.maxEntries || DEFAULT_MAX_ENTRIES;
+    this.ttlMs = options.ttlMs || DEFAULT_TTL_MS;
+    this.entries = new Map();
+  }
+
+  /**
+   * Builds a cache key from everything that determines a response
+   * @param {...string} parts - Model, token limit, prompt, ...
+   * @returns {string} Hex digest
+   */
+  static createKey(...parts) {
+    const hash = crypto.createHash('sha256');
+    parts.forEach(part => hash.update(String(part)).update('\0'));
+    return hash.digest('hex');
+  }
+
+  /**
+   * Returns the cached response for a key, or null on a miss or expired entry
+   * @param {string} key - Cache key
+   * @returns {Promise<string|null>} Cached response text
+   */
+  async get(key) {
+    let entry = this.entries.get(key);
+    if (entry) {
+      // Re-insert so the entry becomes the most recently used
+      this.entries.delete(key);
+    } else if (this.cacheDir) {
+      try {
+        entry = await fs.readJson(this.getEntryPath(key));
+      } catch (error) {
+        entry = null;
+      }
+    }
+
+    if (!entry || Date.now() - entry.createdAt > this.ttlMs) {
+      return null;
+    }
+
+    this.remember(key, entry);
+    return entry.text;
+  }
+
+  /**
+   * Stores a response in memory and, if configured, on disk
+   * @param {string} key - Cache key
+   * @param {string} text - Response text
+   */
+  async set(key, text) {
+    const entry = { createdAt: Date.now(), text };
+    this.remember(key, entry);
+
+    if (!this.cacheDir) return;
+
+    const entryPath = this.getEntryPath(key);
+    const tempPath = `${entryPath}.${process.pid}.tmp`;
+    try {
+      await fs.ensureDir(this.cacheDir);
+      await fs.writeJson(tempPath, entry);
+      await fs.rename(tempPath, entryPath);
+    } catch (error) {
+      console.warn(`     ⚠️  Could not cache LLM response ${key.substring(0, 12)}: ${error.message}`);
+      await fs.remove(tempPath).catch(() => {});
+    }
+  }
+
+  remember(key, entry) {
+    this.entries.delete(key);
+    if (this.entries.size >= this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+    this.entries.set(key, entry);
+  }
+
+  getEntryPath(key) {
+    return path.join(this.cacheDir, `${key}.json`);
+  }
+}
+
+module.exports = { ResponseCache };
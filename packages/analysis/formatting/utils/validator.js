@@ -1,3 +1,6 @@
+// overall_summary fields that must be arrays of strings
+const SUMMARY_STRING_LIST_FIELDS = ['most_critical_issues', 'top_recommendations', 'key_strengths'];
+
 /**
  * Validates structured data for individual pages + overall summary format
  */
@@ -75,26 +78,15 @@ function validateStructuredData(data) {
       summary.site_score_explanation = 'Site score explanation not provided or invalid.';
       errors.push('overall_summary.site_score_explanation is missing, not a string, or empty');
     }
-    if (!Array.isArray(summary.most_critical_issues)) {
-      summary.most_critical_issues = []; errors.push('overall_summary.most_critical_issues must be an array');
-    } else {
-      summary.most_critical_issues.forEach((item, i) => {
-        if(typeof item !== 'string') errors.push(`overall_summary.most_critical_issues[${i}] is not a string`);
-      });
-    }
-    if (!Array.isArray(summary.top_recommendations)) {
-      summary.top_recommendations = []; errors.push('overall_summary.top_recommendations must be an array');
-    } else {
-      summary.top_recommendations.forEach((item, i) => {
-        if(typeof item !== 'string') errors.push(`overall_summary.top_recommendations[${i}] is not a string`);
-      });
-    }
-    if (!Array.isArray(summary.key_strengths)) {
-      summary.key_strengths = []; errors.push('overall_summary.key_strengths must be an array');
-    } else {
-      summary.key_strengths.forEach((item, i) => {
-        if(typeof item !== 'string') errors.push(`overall_summary.key_strengths[${i}] is not a string`);
-      });
+    for (const field of SUMMARY_STRING_LIST_FIELDS) {
+      const items = summary[field];
+      if (!Array.isArray(items)) {
+        summary[field] = []; errors.push(`overall_summary.${field} must be an array`);
+        continue;
+      }
+      for (let i = 0; i < items.length; i++) {
+        if (typeof items[i] !== 'string') errors.push(`overall_summary.${field}[${i}] is not a string`);
+      }
     }
     if (!summary.performance_summary || typeof summary.performance_summary !== 'string') {
       summary.performance_summary = 'Performance summary not provided or invalid.';
@@ -107,15 +99,16 @@ function validateStructuredData(data) {
   }
 
   // Validate page_analyses
-  if (data.page_analyses) {
-    if (!Array.isArray(data.page_analyses)) {
+  const pageAnalyses = data.page_analyses;
+  if (pageAnalyses) {
+    if (!Array.isArray(pageAnalyses)) {
       errors.push('page_analyses should be an array');
       data.page_analyses = [];
     } else {
-      data.page_analyses.forEach((page, i) => {
+      pageAnalyses.forEach((page, i) => {
         if (!page || typeof page !== 'object') {
           errors.push(`Page analysis ${i} is not a valid object.`);
-          data.page_analyses[i] = { 
+          pageAnalyses[i] = { 
             title: `Invalid Page Data ${i}`, 
             overall_score: 1, 
             key_issues: [], 
@@ -200,18 +193,19 @@ function validateStructuredData(data) {
   }
 
   // Validate metadata
-  if (data.metadata) {
-    if (typeof data.metadata.total_pages !== 'number') {
-      data.metadata.total_pages = (data.page_analyses || []).length;
+  const metadata = data.metadata;
+  if (metadata) {
+    if (typeof metadata.total_pages !== 'number') {
+      metadata.total_pages = (data.page_analyses || []).length;
     }
-    if (!data.metadata.analysis_provider || typeof data.metadata.analysis_provider !== 'string') {
-      data.metadata.analysis_provider = 'unknown';
+    if (!metadata.analysis_provider || typeof metadata.analysis_provider !== 'string') {
+      metadata.analysis_provider = 'unknown';
     }
-    if (!data.metadata.analysis_model || typeof data.metadata.analysis_model !== 'string') {
-      data.metadata.analysis_model = 'unknown';
+    if (!metadata.analysis_model || typeof metadata.analysis_model !== 'string') {
+      metadata.analysis_model = 'unknown';
     }
-    if (!data.metadata.generated_at || typeof data.metadata.generated_at !== 'string') {
-      data.metadata.generated_at = new Date().toISOString();
+    if (!metadata.generated_at || typeof metadata.generated_at !== 'string') {
+      metadata.generated_at = new Date().toISOString();
     }
   }
 
@@ -1,11 +1,15 @@
 const fs = require('fs-extra');
 const path = require('path');
 
+// Screenshots read in parallel when embedding them into report data
+const SCREENSHOT_READ_CONCURRENCY = 8;
+
 class ReportGenerator {
   constructor(options = {}) {
     this.outputDir = options.outputDir || '/app/data/reports'; 
     this.screenshotsSourceDir = options.screenshotsSourceDir || options.screenshotsDir || '/app/data/screenshots';
     this.usedIds = new Set();
+    this.sourceScreenshotFiles = null;
 
     console.log(`📁 ReportGenerator initialized:`);
     console.log(`   Screenshots source: ${this.screenshotsSourceDir}`);
@@ -15,8 +19,9 @@ class ReportGenerator {
     try {
       console.log(`🔍 Generating temporary report for immediate display`);
 
-      // Reset used IDs for each generation
+      // Reset used IDs and the screenshot listing for each generation
       this.usedIds.clear();
+      this.sourceScreenshotFiles = null;
 
       // Process the analysis data for Next.js consumption
       const reportData = await this.prepareReportDataForNextJs(analysisData);
@@ -44,6 +49,11 @@ class ReportGenerator {
       throw new Error('Invalid analysisData structure: missing overall_summary, page_analyses, or metadata.');
     }
 
+    // One directory listing serves both the per-page filename lookup and the embedded screenshot data
+    const screenshotListing = await this.listScreenshotFiles();
+    // Pages are matched to screenshots by index, which has always counted only lowercase .png names
+    this.sourceScreenshotFiles = screenshotListing.screenshotFiles.filter(file => file.endsWith('.png'));
+
     const processedPageAnalyses = analysisData.page_analyses.map((page, index) => {
       const pageId = this.createUniquePageId(page, index);
       const screenshotFilename = this.findActualScreenshotFilename(page.url, index, analysisData.page_analyses);
@@ -72,28 +82,23 @@ class ReportGenerator {
         total_pages: processedPageAnalyses.length
       },
       // Add screenshot data directly to the report
-      screenshots: await this.getScreenshotData()
+      screenshots: await this.getScreenshotData(screenshotListing)
     };
 
     console.log(`    ✅ Report data prepared for ${processedPageAnalyses.length} pages`);
     return reportData;
   }
 
-  async getScreenshotData() {
+  async getScreenshotData(screenshotListing) {
     console.log('  📸 Collecting screenshot data...');
     
     try {
-      // Check for screenshots in desktop subdirectory first
-      const desktopDir = path.join(this.screenshotsSourceDir, 'desktop');
-      const sourceDir = await fs.pathExists(desktopDir) ? desktopDir : this.screenshotsSourceDir;
+      const { sourceDir, screenshotFiles } = screenshotListing || await this.listScreenshotFiles();
       
-      if (!await fs.pathExists(sourceDir)) {
-        console.log(`    ⚠️  Screenshots directory not found: ${sourceDir}`);
+      if (!sourceDir) {
+        console.log(`    ⚠️  Screenshots directory not found: ${this.screenshotsSourceDir}`);
         return {};
       }
-
-      const files = await fs.readdir(sourceDir);
-      const screenshotFiles = files.filter(file => file.toLowerCase().endsWith('.png'));
       
       if (screenshotFiles.length === 0) {
         console.log(`    ⚠️  No screenshot files found in: ${sourceDir}`);
@@ -101,11 +106,14 @@ class ReportGenerator {
       }
 
       const screenshotData = {};
-      for (const file of screenshotFiles) {
-        const filePath = path.join(sourceDir, file);
-        const buffer = await fs.readFile(filePath);
-        const base64 = buffer.toString('base64');
-        screenshotData[file] = `data:image/png;base64,${base64}`;
+      // Read a bounded number of files at once; keys are assigned in listing order
+      for (let i = 0; i < screenshotFiles.length; i += SCREENSHOT_READ_CONCURRENCY) {
+        const batch = screenshotFiles.slice(i, i + SCREENSHOT_READ_CONCURRENCY);
+        // Let readFile encode directly so no Buffer outlives the read
+        const encoded = await Promise.all(batch.map(file => fs.readFile(path.join(sourceDir, file), 'base64')));
+        batch.forEach((file, index) => {
+          screenshotData[file] = `data:image/png;base64,${encoded[index]}`;
+        });
       }
       
       console.log(`    ✅ ${screenshotFiles.length} screenshots encoded to base64`);
@@ -116,6 +124,35 @@ class ReportGenerator {
     }
   }
 
+  /**
+   * Lists the PNG screenshots, preferring the desktop subdirectory. Missing
+   * directories are detected from the readdir error instead of a separate
+   * existence check.
+   * @returns {Promise<{sourceDir: string|null, screenshotFiles: string[]}>} Directory read and its sorted PNG filenames
+   */
+  async listScreenshotFiles() {
+    const candidateDirs = [path.join(this.screenshotsSourceDir, 'desktop'), this.screenshotsSourceDir];
+
+    for (const sourceDir of candidateDirs) {
+      let entries;
+      try {
+        entries = await fs.readdir(sourceDir, { withFileTypes: true });
+      } catch (error) {
+        if (error.code === 'ENOENT') continue;
+        throw error;
+      }
+
+      // Not isFile(): symlinked screenshots must stay in the listing
+      const screenshotFiles = entries
+        .filter(entry => !entry.isDirectory() && entry.name.toLowerCase().endsWith('.png'))
+        .map(entry => entry.name)
+        .sort();
+      return { sourceDir, screenshotFiles };
+    }
+
+    return { sourceDir: null, screenshotFiles: [] };
+  }
+
   createUniquePageId(page, index) {
     const baseId = page.id || 
                    page.title?.toLowerCase().replace(/[^a-z0-9]/g, '-').substring(0, 30) || 
@@ -134,15 +171,7 @@ class ReportGenerator {
   }
   
   findActualScreenshotFilename(url, index, allPageAnalyses) {
-    const sourceBaseDir = path.join(this.screenshotsSourceDir, 'desktop');
-    let filesInSourceDir = [];
-    if (fs.existsSync(sourceBaseDir)) {
-      filesInSourceDir = fs.readdirSync(sourceBaseDir);
-    } else if (fs.existsSync(this.screenshotsSourceDir)) {
-      filesInSourceDir = fs.readdirSync(this.screenshotsSourceDir);
-    }
-    
-    const pngFiles = filesInSourceDir.filter(f => f.endsWith('.png')).sort();
+    const pngFiles = this.sourceScreenshotFiles || [];
 
     if (pngFiles[index]) {
       return pngFiles[index];
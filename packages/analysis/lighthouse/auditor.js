@@ -20,6 +20,9 @@ class LighthouseAuditor {
     this.retries = options.retries || 1;
     this.browser = null;
     this.timeout = options.timeout || 60000; // 60 second timeout
+    // Full reports are multi-megabyte raw dumps; only pretty-print them on request
+    this.prettyFullReports = options.prettyFullReports ??
+      ['1', 'true', 'yes'].includes(String(process.env.LIGHTHOUSE_PRETTY_JSON).toLowerCase());
     
     // Create output directories
     this.reportsDir = path.join(this.outputDir, 'reports');
@@ -134,7 +137,7 @@ class LighthouseAuditor {
         
         // Save full report
         const fullReportPath = path.join(this.reportsDir, jsonFilename);
-        await fs.writeJson(fullReportPath, result.lhr, { spaces: 2 });
+        await fs.writeJson(fullReportPath, result.lhr, this.prettyFullReports ? { spaces: 2 } : {});
         
         // Trim and save essential data
         const trimmedReport = trimReport(result.lhr);
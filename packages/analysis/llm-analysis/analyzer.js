@@ -1,14 +1,13 @@
 require('dotenv').config(); // Load environment variables
 
-const Anthropic = require('@anthropic-ai/sdk');
-
-// Import OpenAI only when needed
+// Import provider SDKs only when needed
+let Anthropic;
 let OpenAI;
 
 const fs = require('fs-extra');
 const path = require('path');
-const { prepareImageForLLM } = require('./utils');
-const { getAnalysisPrompt } = require('./prompts/analysis-prompt');
+const { prepareImageForLLM, estimateTokens } = require('./utils');
+const { getAnalysisPrompt, getPagePromptBlocks, DEFAULT_ORG_CONTEXT } = require('./prompts/analysis-prompt');
 const { getTechnicalPrompt } = require('./prompts/technical-prompt');
 
 class LLMAnalyzer {
@@ -19,23 +18,22 @@ class LLMAnalyzer {
     this.screenshotsDir = options.screenshotsDir;
     this.lighthouseDir = options.lighthouseDir;
     
-    // Organization context - ensure it has the proper structure
-    const defaultOrgContext = {
-      org_name: 'the organization',
-      org_type: 'organization',
-      org_purpose: 'to achieve its business goals and serve its users effectively'
-    };
+    // Optional ceiling on estimated prompt tokens per page; unset means no check
+    this.promptTokenBudget = options.promptTokenBudget || null;
     
-    // Merge provided orgContext with defaults
+    // Organization context - merge provided values over the shared defaults
     this.orgContext = {
-      ...defaultOrgContext,
+      ...DEFAULT_ORG_CONTEXT,
       ...options.orgContext
     };
     
     // Ensure all required properties exist and are strings
-    this.orgContext.org_name = this.orgContext.org_name || defaultOrgContext.org_name;
-    this.orgContext.org_type = this.orgContext.org_type || defaultOrgContext.org_type;
-    this.orgContext.org_purpose = this.orgContext.org_purpose || defaultOrgContext.org_purpose;
+    this.orgContext.org_name = this.orgContext.org_name || DEFAULT_ORG_CONTEXT.org_name;
+    this.orgContext.org_type = this.orgContext.org_type || DEFAULT_ORG_CONTEXT.org_type;
+    this.orgContext.org_purpose = this.orgContext.org_purpose || DEFAULT_ORG_CONTEXT.org_purpose;
+    
+    // Frozen so prompt builders can resolve it once and reuse the result for every page
+    Object.freeze(this.orgContext);
     
     console.log(`🏢 LLMAnalyzer initialized with org context:`, this.orgContext);
     
@@ -57,6 +55,9 @@ class LLMAnalyzer {
       
       console.log(`API Key loaded from environment: ${apiKey.substring(0, 8)}...`);
       
+      if (!Anthropic) {
+        Anthropic = require('@anthropic-ai/sdk');
+      }
       this.client = new Anthropic({
         apiKey: apiKey,
       });
@@ -88,26 +89,29 @@ class LLMAnalyzer {
       }
       
       const files = await fs.readdir(this.screenshotsDir);
-      const screenshots = [];
       
-      for (const file of files) {
-        if (file.endsWith('.png')) {
+      // Sort by filename up front so each result can be written to its final slot
+      const pngFiles = files.filter(file => file.endsWith('.png')).sort((a, b) => a.localeCompare(b));
+      const screenshots = new Array(pngFiles.length);
+      
+      // Prepare images concurrently, bounded by the analyzer concurrency
+      for (let i = 0; i < pngFiles.length; i += this.concurrency) {
+        const batch = pngFiles.slice(i, i + this.concurrency);
+        
+        await Promise.all(batch.map(async (file, batchIndex) => {
           const filePath = path.join(this.screenshotsDir, file);
           console.log(`📸 Processing screenshot: ${file}`);
           const imageData = await prepareImageForLLM(filePath);
           
-          screenshots.push({
+          screenshots[i + batchIndex] = {
             filename: file,
             path: filePath,
             imageData: imageData,
             url: this.extractUrlFromFilename(file)
-          });
-        }
+          };
+        }));
       }
       
-      // Sort by filename to ensure consistent order
-      screenshots.sort((a, b) => a.filename.localeCompare(b.filename));
-      
       return screenshots;
     } catch (error) {
       console.error('Error loading screenshots:', error);
@@ -194,10 +198,24 @@ class LLMAnalyzer {
       const pageAnalyses = [];
       const batchSize = this.concurrency;
       
-      for (let i = 0; i < analysisData.length; i += batchSize) {
-        const batch = analysisData.slice(i, i + batchSize);
-        const batchNumber = Math.floor(i / batchSize) + 1;
-        const totalBatches = Math.ceil(analysisData.length / batchSize);
+      // The first Anthropic request writes the cached prompt prefix. Running it on
+      // its own lets every later page read that cache instead of the whole first
+      // batch missing it concurrently.
+      const batchStarts = [];
+      const warmupSize = this.provider === 'anthropic' && analysisData.length > 1 ? 1 : 0;
+      if (warmupSize > 0) {
+        batchStarts.push(0);
+      }
+      for (let start = warmupSize; start < analysisData.length; start += batchSize) {
+        batchStarts.push(start);
+      }
+      
+      for (let b = 0; b < batchStarts.length; b++) {
+        const i = batchStarts[b];
+        const batchEnd = b + 1 < batchStarts.length ? batchStarts[b + 1] : analysisData.length;
+        const batch = analysisData.slice(i, batchEnd);
+        const batchNumber = b + 1;
+        const totalBatches = batchStarts.length;
         
         console.log(`   Batch ${batchNumber}/${totalBatches}: Analyzing ${batch.length} pages concurrently...`);
         
@@ -232,7 +250,7 @@ class LLMAnalyzer {
         pageAnalyses.push(...batchResults);
         
         // Add a small delay between batches to be respectful to the API
-        if (i + batchSize < analysisData.length) {
+        if (batchEnd < analysisData.length) {
           await new Promise(resolve => setTimeout(resolve, 500));
         }
       }
@@ -269,130 +287,54 @@ class LLMAnalyzer {
     console.log(`🧠 Calling LLM for page analysis for ${url}...`);
     
     // Prepare the prompt with orgContext
-    const prompt = getAnalysisPrompt('page', {
+    const promptData = {
       url: url,
       lighthouse: lighthouseData,
       context: this.orgContext
-    });
+    };
     
-    if (this.provider === 'anthropic') {
-      try {
-        const response = await this.client.messages.create({
-          model: this.model,
-          max_tokens: 4000,
-          messages: [
-            {
-              role: 'user',
-              content: [
-                {
-                  type: 'text',
-                  text: prompt
-                },
-                {
-                  type: 'image',
-                  source: {
-                    type: 'base64',
-                    media_type: screenshot.imageData.mediaType,
-                    data: screenshot.imageData.data
-                  }
-                }
-              ]
-            }
-          ]
-        });
-        
-        const analysisText = response.content[0].text;
-        
-        return {
-          url: url,
-          analysis: analysisText,
-          screenshot: screenshot.filename,
-          lighthouse: lighthouseData ? 'included' : 'not_available',
-          timestamp: new Date().toISOString(),
-          provider: this.provider,
-          model: this.model
-        };
-        
-      } catch (error) {
-        console.error(`Error analyzing page ${url}:`, error);
-        throw error;
-      }
-    } else if (this.provider === 'openai') {
-      // OpenAI implementation
-      try {
-        const response = await this.client.chat.completions.create({
-          model: this.model,
-          max_tokens: 4000,
-          messages: [
-            {
-              role: 'user',
-              content: [
-                {
-                  type: 'text',
-                  text: prompt
-                },
-                {
-                  type: 'image_url',
-                  image_url: {
-                    url: `data:${screenshot.imageData.mediaType};base64,${screenshot.imageData.data}`
-                  }
-                }
-              ]
-            }
-          ]
-        });
-        
-        const analysisText = response.choices[0].message.content;
-        
-        return {
-          url: url,
-          analysis: analysisText,
-          screenshot: screenshot.filename,
-          lighthouse: lighthouseData ? 'included' : 'not_available',
-          timestamp: new Date().toISOString(),
-          provider: this.provider,
-          model: this.model
-        };
-        
-      } catch (error) {
-        console.error(`Error analyzing page ${url}:`, error);
-        throw error;
+    // Anthropic gets the static prefix as its own cacheable block
+    const promptBlocks = this.provider === 'anthropic'
+      ? getPagePromptBlocks(promptData)
+      : [{ type: 'text', text: getAnalysisPrompt('page', promptData) }];
+    
+    if (this.promptTokenBudget) {
+      const promptTokens = promptBlocks.reduce((total, block) => total + estimateTokens(block.text), 0);
+      if (promptTokens > this.promptTokenBudget) {
+        throw new Error(`Page prompt for ${url} is ~${promptTokens} tokens, over the budget of ${this.promptTokenBudget}`);
       }
     }
-  }
-  
-  async generateTechnicalSummary(pageAnalyses, lighthouseData) {
-    const prompt = getTechnicalPrompt(this.orgContext, pageAnalyses, lighthouseData);
     
-    if (this.provider === 'anthropic') {
-      const response = await this.client.messages.create({
-        model: this.model,
-        max_tokens: 3000,
-        messages: [
-          {
-            role: 'user',
-            content: prompt
-          }
-        ]
-      });
+    try {
+      const analysisText = await this.createCompletion([
+        ...promptBlocks,
+        this.createImageBlock(screenshot.imageData)
+      ], 4000);
       
-      return response.content[0].text;
-    } else if (this.provider === 'openai') {
-      const response = await this.client.chat.completions.create({
-        model: this.model,
-        max_tokens: 3000,
-        messages: [
-          {
-            role: 'user',
-            content: prompt
-          }
-        ]
-      });
+      return {
+        url: url,
+        analysis: analysisText,
+        screenshot: screenshot.filename,
+        lighthouse: lighthouseData ? 'included' : 'not_available',
+        timestamp: new Date().toISOString(),
+        provider: this.provider,
+        model: this.model
+      };
       
-      return response.choices[0].message.content;
+    } catch (error) {
+      console.error(`Error analyzing page ${url}:`, error);
+      throw error;
     }
   }
   
+  async generateTechnicalSummary(pageAnalyses, lighthouseData) {
+    const prompt = getTechnicalPrompt('summary', {
+      lighthouseData: lighthouseData.map(report => ({ url: report.url, lighthouse: report.data }))
+    });
+    
+    return this.createCompletion(prompt, 3000);
+  }
+  
   async generateOverview(pageAnalyses, technicalSummary) {
     const prompt = `Based on the following page analyses and technical summary, provide a high-level overview of the website for ${this.orgContext.org_name}:
 
@@ -407,33 +349,63 @@ ${analysis.analysis}
 
 Please provide a comprehensive overview that synthesizes all findings into key insights and actionable recommendations for ${this.orgContext.org_name} ${this.orgContext.org_purpose}.`;
 
+    return this.createCompletion(prompt, 2000);
+  }
+  
+  /**
+   * Builds the provider-specific content block for a prepared image
+   * @param {Object} imageData - Image data from prepareImageForLLM
+   * @returns {Object} Image content block
+   */
+  createImageBlock(imageData) {
     if (this.provider === 'anthropic') {
-      const response = await this.client.messages.create({
-        model: this.model,
-        max_tokens: 2000,
-        messages: [
-          {
-            role: 'user',
-            content: prompt
-          }
-        ]
-      });
-      
+      return {
+        type: 'image',
+        source: {
+          type: 'base64',
+          media_type: imageData.mediaType,
+          data: imageData.data
+        }
+      };
+    }
+    
+    return {
+      type: 'image_url',
+      image_url: {
+        url: `data:${imageData.mediaType};base64,${imageData.data}`
+      }
+    };
+  }
+  
+  /**
+   * Sends a single user message to the configured provider
+   * @param {string|Array} content - Message content (text or content blocks)
+   * @param {number} maxTokens - Maximum tokens to generate
+   * @returns {Promise<string>} Response text
+   */
+  async createCompletion(content, maxTokens) {
+    const request = {
+      model: this.model,
+      max_tokens: maxTokens,
+      messages: [
+        {
+          role: 'user',
+          content: content
+        }
+      ]
+    };
+    
+    if (this.provider === 'anthropic') {
+      const response = await this.client.messages.create(request);
+      if (Array.isArray(content) && content.some(block => block.cache_control)) {
+        const usage = response.usage || {};
+        console.log(`  🗄️  Prompt cache: ${usage.cache_read_input_tokens || 0} tokens read, ${usage.cache_creation_input_tokens || 0} written`);
+      }
       return response.content[0].text;
-    } else if (this.provider === 'openai') {
-      const response = await this.client.chat.completions.create({
-        model: this.model,
-        max_tokens: 2000,
-        messages: [
-          {
-            role: 'user',
-            content: prompt
-          }
-        ]
-      });
-      
-      return response.choices[0].message.content;
     }
+    
+    const response = await this.client.chat.completions.create(request);
+    return response.choices[0].message.content;
   }
   
   extractUrlFromFilename(filename) {
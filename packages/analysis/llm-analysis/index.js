@@ -3,6 +3,7 @@ require('dotenv').config(); // Load environment variables
 const fs = require('fs-extra');
 const path = require('path');
 const { LLMAnalyzer } = require('./analyzer');
+const { DEFAULT_ORG_CONTEXT, getPagePromptDigest } = require('./prompts/analysis-prompt');
 
 class LLMAnalysisService {
   constructor(options = {}) {
@@ -12,15 +13,16 @@ class LLMAnalysisService {
     this.screenshotsDir = options.screenshotsDir || './data/screenshots';
     this.lighthouseDir = options.lighthouseDir || './data/lighthouse';
     this.outputDir = options.outputDir || './data/analysis';
+    this.promptTokenBudget = options.promptTokenBudget || parseInt(process.env.LLM_PROMPT_TOKEN_BUDGET, 10) || null;
     
     // IMPORTANT: Add support for specific URLs
     this.specificUrls = options.specificUrls || null;
     
     // Organization context - can be overridden via options or environment
     this.orgContext = {
-      org_name: options.org_name || process.env.ORG_NAME || 'the organization',
-      org_type: options.org_type || process.env.ORG_TYPE || 'organization',
-      org_purpose: options.org_purpose || process.env.ORG_PURPOSE || 'to achieve its business goals and serve its users effectively'
+      org_name: options.org_name || process.env.ORG_NAME || DEFAULT_ORG_CONTEXT.org_name,
+      org_type: options.org_type || process.env.ORG_TYPE || DEFAULT_ORG_CONTEXT.org_type,
+      org_purpose: options.org_purpose || process.env.ORG_PURPOSE || DEFAULT_ORG_CONTEXT.org_purpose
     };
   }
 
@@ -128,6 +130,7 @@ class LLMAnalysisService {
         concurrency: this.concurrency,
         screenshotsDir: this.screenshotsDir,
         lighthouseDir: this.lighthouseDir,
+        promptTokenBudget: this.promptTokenBudget,
         orgContext: this.orgContext
       });
       
@@ -237,6 +240,7 @@ class LLMAnalysisService {
         screenshots_analyzed: screenshots.length,
         lighthouse_reports_analyzed: lighthouseData.length,
         analysis_version: '1.0.0',
+        page_prompt_digest: getPagePromptDigest(),
         organization: this.orgContext,
         specificUrls: this.specificUrls || null
       };
@@ -1,11 +1,23 @@
-function getScoringDefinitions() {
-  return `
+const crypto = require('crypto');
+
+// Defaults used when no organization context is supplied
+const DEFAULT_ORG_CONTEXT = Object.freeze({
+  org_name: 'the organization',
+  org_type: 'organization',
+  org_purpose: 'to achieve its business goals and serve its users effectively'
+});
+
+// Static prompt blocks, built once at load. The rubric is shared with the
+// technical prompt.
+const SCORING_RUBRIC = `
     SCORING RUBRIC:
     1-3: Poor - Significantly hinders user experience and requires immediate attention
     4-5: Below Average - Has notable issues affecting effectiveness
     6-7: Average - Functional but with clear opportunities for improvement
     8-9: Good - Effectively supports goals with minor refinements needed
-    10: Excellent - Exemplary implementation with no significant issues
+    10: Excellent - Exemplary implementation with no significant issues`;
+
+const SCORING_DEFINITIONS = `${SCORING_RUBRIC}
 
     BASELINE EXPECTATIONS:
     - Good technical performance (fast loading, mobile responsiveness) is STANDARD and should not be praised as exceptional
@@ -13,14 +25,14 @@ function getScoringDefinitions() {
     - Incomplete, placeholder, or outdated content should be flagged and penalized
     - Images should be evaluated for content relevance and support of organizational goals, NOT technical quality
   `;
+
+function getScoringDefinitions() {
+  return SCORING_DEFINITIONS;
 }
 
-function getEvaluationGuidelines(orgContext) {
-  return `
-    CRITICAL EVALUATION GUIDELINES:
-    
-    ORGANIZATIONAL CONTEXT: This is a ${orgContext.org_type} whose website aims ${orgContext.org_purpose}
-    
+// Evaluation criteria shared by every prompt; the organization context is
+// supplied separately so this text stays identical across calls
+const EVALUATION_CRITERIA = `
     RED FLAGS TO ALWAYS IDENTIFY:
     - Placeholder text (Lorem ipsum, "Coming soon", "Under construction")
     - Outdated information (old dates, expired events, obsolete pricing)
@@ -40,10 +52,8 @@ function getEvaluationGuidelines(orgContext) {
     - Does the page fulfill its role in the user journey?
     - Are there logical next steps for users?
   `;
-}
 
-function getExampleSection() {
-  return `
+const EXAMPLE_SECTION = `
     EXAMPLES OF PROPERLY FORMATTED RESPONSES:
     
     CRITICAL FLAWS EXAMPLE:
@@ -60,30 +70,93 @@ function getExampleSection() {
     - Content doesn't address common user questions about services
     - EVIDENCE: The "Our Services" section displays "Content coming soon" instead of actual service details, and the pricing page shows placeholder pricing tables.
   `;
+
+function getExampleSection() {
+  return EXAMPLE_SECTION;
 }
 
-function createAnalysisPrompt(pageType, context, sections) {
-  let prompt = `You are a UX/UI expert analyzing a ${pageType} for ${context.org_name || 'this organization'}, a ${context.org_type || 'organization'}.
-    
-    WEBSITE PURPOSE: ${context.org_purpose || 'to achieve its business goals and serve its users effectively'}
-    
-    ${getScoringDefinitions()}
-    
-    ${getEvaluationGuidelines(context)}
-    
-    Provide a detailed, critical analysis focusing on how well this supports the organization's goals and serves users effectively.\n\n`;
-    
-    // Add each section
-    sections.forEach(section => {
-      prompt += `${section.number}. ${section.name} (Score: ?/10)\n`;
-      section.questions.forEach(question => {
-        prompt += `   - ${question}\n`;
-      });
-      prompt += `   - EVIDENCE: Cite specific examples from the ${pageType}\n\n`;
-    });
-    
-    // Add standard sections at the end
-    prompt += `
+// Sections of the per-page analysis, built once at load
+const PAGE_SECTIONS = [
+  {
+    number: 1,
+    name: "FIRST IMPRESSION & CLARITY",
+    questions: [
+      "How quickly can a visitor understand what this page offers and why it matters to them?",
+      "Does the visual hierarchy effectively guide users to the most important information first?",
+      "Is the page's value proposition immediately clear and compelling for the organization's target audience?",
+      "Are there any placeholder, incomplete, or obviously unfinished elements that undermine credibility?"
+    ]
+  },
+  {
+    number: 2,
+    name: "GOAL ALIGNMENT & CONTENT RELEVANCE",
+    questions: [
+      "How effectively does this page's content advance the WEBSITE PURPOSE given in the CONTEXT section?",
+      "Is all content directly relevant to this page's role in the user journey?",
+      "Does the information provided enable users to make informed decisions or take meaningful action?",
+      "Are there clear, logical next steps that align with organizational goals?",
+      "Is any content outdated, irrelevant, or misaligned with the page's intended purpose?"
+    ]
+  },
+  {
+    number: 3,
+    name: "VISUAL DESIGN & CONTENT PRESENTATION",
+    questions: [
+      "How effectively does the visual design support content comprehension and goal achievement?",
+      "Do images and visuals directly support the organization's message and page purpose (ignore technical image quality)?",
+      "Does the layout create clear information hierarchy that guides users through key messages?",
+      "Is the design professional and trustworthy for this organization type?",
+      "Are visual elements purposeful rather than decorative?"
+    ]
+  },
+  {
+    number: 4,
+    name: "CONTENT COMPLETENESS & QUALITY",
+    questions: [
+      "Is all essential information present and complete (no placeholder or 'coming soon' content)?",
+      "Does the content answer the questions users likely have when visiting this page?",
+      "Is the information current, accurate, and actionable?",
+      "Does the content demonstrate expertise and build trust in the organization?",
+      "Are there gaps in information that prevent users from moving forward in their journey?"
+    ]
+  },
+  {
+    number: 5,
+    name: "USER JOURNEY & DECISION SUPPORT",
+    questions: [
+      "Does this page provide clear pathways for users to achieve their goals?",
+      "Are potential user concerns or objections addressed within the content?",
+      "Is there sufficient information for users to feel confident taking the next step?",
+      "Are interactive elements intuitive and functional for their intended purpose?",
+      "Does the page reduce friction in the user's decision-making process?"
+    ]
+  },
+  {
+    number: 6,
+    name: "CONVERSION & ENGAGEMENT OPTIMIZATION",
+    questions: [
+      "How effectively does this page guide users toward desired organizational outcomes?",
+      "Are calls-to-action clear, compelling, and appropriately positioned for the page context?",
+      "Does the page build sufficient trust and credibility to encourage user action?",
+      "Are there unnecessary barriers or distractions that could prevent conversion?",
+      "Does the page create appropriate urgency or motivation for user engagement?"
+    ]
+  },
+  {
+    number: 7,
+    name: "TECHNICAL EXECUTION & ACCESSIBILITY",
+    questions: [
+      "Are there any technical issues that significantly impact user experience or goal achievement?",
+      "Would users with different abilities be able to access and use this page effectively?",
+      "Are there broken links, missing functionality, or obvious technical problems?",
+      "NOTE: Only highlight technical performance if notably poor (impacting UX) or exceptionally good",
+      "Focus on accessibility and functionality rather than basic responsive design"
+    ]
+  }
+];
+
+// Instructions that follow the numbered sections of every analysis prompt
+const ANALYSIS_TRAILER = `
     CRITICAL FLAWS:
     - Identify the 3 most significant problems that hinder the organization's goals (numbered)
     - Rate each issue's severity (High/Medium/Low) based on impact on user success and organizational objectives
@@ -101,16 +174,166 @@ function createAnalysisPrompt(pageType, context, sections) {
     - 2-3 sentence summary highlighting the biggest barriers to success and key opportunities
     - Single highest-priority action that would most improve organizational goal achievement
     `;
+
+// Opening of every analysis prompt, ahead of the numbered sections
+const ANALYSIS_INTRO = `You are a UX/UI expert analyzing a page of an organization's website. The organization, its website purpose and the page type are given in the CONTEXT section at the end of this prompt.
+    
+    ${SCORING_DEFINITIONS}
+    
+    CRITICAL EVALUATION GUIDELINES:
+    ${EVALUATION_CRITERIA}
     
-    return prompt;
+    Provide a detailed, critical analysis focusing on how well this supports the organization's goals and serves users effectively.
+    End every numbered section with an EVIDENCE bullet citing specific examples from the page.\n\n`;
+
+/**
+ * Render one numbered section with its questions.
+ * @param {Object} section - Section with number, name and questions
+ * @returns {string} Section text
+ */
+function renderSection(section) {
+  const questions = section.questions.map(question => `   - ${question}\n`).join('');
+  return `${section.number}. ${section.name} (Score: ?/10)\n${questions}\n`;
+}
+
+/**
+ * Build the context-free part of an analysis prompt. Providers only reuse a
+ * cached prompt prefix on an exact match, so nothing here may depend on the
+ * organization or the page; those go in the trailing context block.
+ * @param {Array} sections - Numbered sections with their questions
+ * @returns {string} Static prompt prefix
+ */
+function createStaticAnalysisPrompt(sections) {
+  return ANALYSIS_INTRO + sections.map(renderSection).join('') + ANALYSIS_TRAILER;
+}
+
+/**
+ * Build the trailing block that carries everything call-specific.
+ * @param {string} pageType - Type of page being analyzed
+ * @param {Object} context - Organization context
+ * @returns {string} Context block
+ */
+function createContextBlock(pageType, context) {
+  return `
+    CONTEXT:
+    ORGANIZATION: ${context.org_name || 'this organization'}, a ${context.org_type || 'organization'}
+    WEBSITE PURPOSE: ${context.org_purpose || DEFAULT_ORG_CONTEXT.org_purpose}
+    PAGE TYPE: ${pageType}
+    `;
+}
+
+function createAnalysisPrompt(pageType, context, sections) {
+  return createStaticAnalysisPrompt(sections) + createContextBlock(pageType, context);
+}
+
+// Instructions that follow the sections in the page prompt only
+const PAGE_ROLE_ANALYSIS = `
+    PAGE ROLE ANALYSIS:
+    - Considering the PAGE TYPE, how completely does this page fulfill its specific purpose in advancing the WEBSITE PURPOSE?
+    - What essential information or functionality is missing that users would expect on this type of page?
+    - How effectively does this page connect users to logical next steps in their journey?
+    - Does the content demonstrate value and build trust appropriate for this stage of user engagement?
+    `;
+
+/**
+ * Strips the source indentation that template literals carry into the prompt
+ * and collapses runs of blank lines. The prompt is a flat list of numbered
+ * sections and bullets, so leading whitespace only costs tokens.
+ * @param {string} text - Prompt text
+ * @returns {string} Compacted prompt text
+ */
+function compactPromptText(text) {
+  return text
+    .replace(/^[ \t]+|[ \t]+$/gm, '')
+    .replace(/\n{3,}/g, '\n\n');
+}
+
+let pagePromptPrefix = null;
+
+/**
+ * Everything in the page prompt that precedes the context block. Rendered on
+ * first use, so loading this module for the other prompts costs nothing.
+ * @returns {string} Static page prompt prefix
+ */
+function getPagePromptPrefix() {
+  if (pagePromptPrefix === null) {
+    pagePromptPrefix = compactPromptText(
+      createStaticAnalysisPrompt(PAGE_SECTIONS) + PAGE_ROLE_ANALYSIS + EXAMPLE_SECTION
+    );
+  }
+  return pagePromptPrefix;
+}
+
+let pagePromptDigest = null;
+
+/**
+ * Stable identity of the static page prompt, computed once per process.
+ * Changes whenever the prompt wording changes, so stored analyses can be
+ * matched to the prompt version that produced them.
+ * @returns {string} sha256 hex digest of the page prompt prefix
+ */
+function getPagePromptDigest() {
+  if (pagePromptDigest === null) {
+    pagePromptDigest = crypto.createHash('sha256').update(getPagePromptPrefix()).digest('hex');
+  }
+  return pagePromptDigest;
+}
+
+// Resolved copies of frozen contexts, so a context shared across every page of
+// a run is resolved once instead of once per prompt
+const resolvedOrgContexts = new WeakMap();
+
+function resolveOrgContext(orgContext) {
+  if (!orgContext) return DEFAULT_ORG_CONTEXT;
+
+  let resolved = resolvedOrgContexts.get(orgContext);
+  if (!resolved) {
+    resolved = Object.freeze({
+      org_name: orgContext.org_name || DEFAULT_ORG_CONTEXT.org_name,
+      org_type: orgContext.org_type || DEFAULT_ORG_CONTEXT.org_type,
+      org_purpose: orgContext.org_purpose || DEFAULT_ORG_CONTEXT.org_purpose
+    });
+    // Only frozen contexts are safe to memoize; a mutable one could change later
+    if (Object.isFrozen(orgContext)) {
+      resolvedOrgContexts.set(orgContext, resolved);
+    }
+  }
+  return resolved;
+}
+
+/**
+ * Build the page-specific tail of the page prompt: context block, URL and Lighthouse data.
+ * @param {Object} data - Page data (url, lighthouse, page_type)
+ * @param {Object} context - Resolved organization context
+ * @returns {string} Page prompt suffix
+ */
+function createPageDetails(data, context) {
+  return createContextBlock(data.page_type || 'webpage', context) + `
+    URL: ${data.url}
+    
+    Lighthouse Performance Context (only mention if scores are notably poor <60% or exceptional >95%):
+    ${data.lighthouse ? formatLighthouseMetrics(data.lighthouse) : 'No lighthouse data available'}
+    `;
+}
+
+/**
+ * Page prompt as Anthropic text blocks, with a cache breakpoint after the
+ * static prefix so it is read from the prompt cache on every page after the first.
+ * The pinned @anthropic-ai/sdk predates prompt caching in its types, but it sends
+ * message content through unchanged and the GA Messages API accepts cache_control
+ * without a beta header; LLMAnalyzer logs cache_read_input_tokens to confirm hits.
+ * @param {Object} data - Page data (url, lighthouse, page_type, context)
+ * @returns {Array} Content blocks
+ */
+function getPagePromptBlocks(data) {
+  return [
+    { type: 'text', text: getPagePromptPrefix(), cache_control: { type: 'ephemeral' } },
+    { type: 'text', text: createPageDetails(data, resolveOrgContext(data.context)) }
+  ];
 }
 
 function getAnalysisPrompt(type, data) {
-  const context = {
-    org_name: data.context?.org_name || 'the organization',
-    org_type: data.context?.org_type || 'organization',
-    org_purpose: data.context?.org_purpose || 'to achieve its business goals and serve its users effectively'
-  };
+  const context = resolveOrgContext(data.context);
 
   switch (type) {
     case 'comprehensive_overview':
@@ -118,7 +341,8 @@ function getAnalysisPrompt(type, data) {
 
       WEBSITE PURPOSE: ${context.org_purpose}
 
-      ${getEvaluationGuidelines(context)}
+      CRITICAL EVALUATION GUIDELINES:
+      ${EVALUATION_CRITERIA}
 
       Please format your response as a Markdown document.
       The main sections of your report should be H2 headings (e.g., ## Section Title).
@@ -151,7 +375,7 @@ function getAnalysisPrompt(type, data) {
       Based on all this comprehensive data, provide the following sections using the specified Markdown heading levels:
 
       ## EXECUTIVE SUMMARY
-         - Provide an overall assessment of the website's effectiveness (Score: ?/10) in achieving: ${context.org_purpose}
+         - Provide an overall assessment of the website's effectiveness (Score: ?/10) in achieving the WEBSITE PURPOSE stated above
          - Focus on content completeness, user value delivery, and conversion potential
          - Summarize the biggest barriers to organizational success and highest-impact opportunities
          - NOTE: Do not praise basic technical performance unless exceptionally poor or outstanding
@@ -181,7 +405,7 @@ function getAnalysisPrompt(type, data) {
            - ...
 
       ## ORGANIZATIONAL ALIGNMENT ASSESSMENT
-         ### How effectively the website supports: ${context.org_purpose}
+         ### How effectively the website supports its stated purpose
            - (Your assessment focused on content, messaging, and user journey effectiveness)
          ### Content gaps preventing goal achievement
            - (Missing information, incomplete sections, unclear value propositions)
@@ -206,102 +430,7 @@ function getAnalysisPrompt(type, data) {
       `;
 
     case 'page':
-      const pageSections = [
-        {
-          number: 1,
-          name: "FIRST IMPRESSION & CLARITY",
-          questions: [
-            "How quickly can a visitor understand what this page offers and why it matters to them?",
-            "Does the visual hierarchy effectively guide users to the most important information first?",
-            "Is the page's value proposition immediately clear and compelling for the organization's target audience?",
-            "Are there any placeholder, incomplete, or obviously unfinished elements that undermine credibility?"
-          ]
-        },
-        {
-          number: 2,
-          name: "GOAL ALIGNMENT & CONTENT RELEVANCE",
-          questions: [
-            `How effectively does this page's content advance the organization's purpose: ${context.org_purpose}?`,
-            "Is all content directly relevant to this page's role in the user journey?",
-            "Does the information provided enable users to make informed decisions or take meaningful action?",
-            "Are there clear, logical next steps that align with organizational goals?",
-            "Is any content outdated, irrelevant, or misaligned with the page's intended purpose?"
-          ]
-        },
-        {
-          number: 3,
-          name: "VISUAL DESIGN & CONTENT PRESENTATION",
-          questions: [
-            "How effectively does the visual design support content comprehension and goal achievement?",
-            "Do images and visuals directly support the organization's message and page purpose (ignore technical image quality)?",
-            "Does the layout create clear information hierarchy that guides users through key messages?",
-            "Is the design professional and trustworthy for this organization type?",
-            "Are visual elements purposeful rather than decorative?"
-          ]
-        },
-        {
-          number: 4,
-          name: "CONTENT COMPLETENESS & QUALITY",
-          questions: [
-            "Is all essential information present and complete (no placeholder or 'coming soon' content)?",
-            "Does the content answer the questions users likely have when visiting this page?",
-            "Is the information current, accurate, and actionable?",
-            "Does the content demonstrate expertise and build trust in the organization?",
-            "Are there gaps in information that prevent users from moving forward in their journey?"
-          ]
-        },
-        {
-          number: 5,
-          name: "USER JOURNEY & DECISION SUPPORT",
-          questions: [
-            "Does this page provide clear pathways for users to achieve their goals?",
-            "Are potential user concerns or objections addressed within the content?",
-            "Is there sufficient information for users to feel confident taking the next step?",
-            "Are interactive elements intuitive and functional for their intended purpose?",
-            "Does the page reduce friction in the user's decision-making process?"
-          ]
-        },
-        {
-          number: 6,
-          name: "CONVERSION & ENGAGEMENT OPTIMIZATION",
-          questions: [
-            "How effectively does this page guide users toward desired organizational outcomes?",
-            "Are calls-to-action clear, compelling, and appropriately positioned for the page context?",
-            "Does the page build sufficient trust and credibility to encourage user action?",
-            "Are there unnecessary barriers or distractions that could prevent conversion?",
-            "Does the page create appropriate urgency or motivation for user engagement?"
-          ]
-        },
-        {
-          number: 7,
-          name: "TECHNICAL EXECUTION & ACCESSIBILITY",
-          questions: [
-            "Are there any technical issues that significantly impact user experience or goal achievement?",
-            "Would users with different abilities be able to access and use this page effectively?",
-            "Are there broken links, missing functionality, or obvious technical problems?",
-            "NOTE: Only highlight technical performance if notably poor (impacting UX) or exceptionally good",
-            "Focus on accessibility and functionality rather than basic responsive design"
-          ]
-        }
-      ];
-
-      let pagePrompt = createAnalysisPrompt(`${data.page_type || 'webpage'}`, context, pageSections);
-      
-      pagePrompt += `
-      URL: ${data.url}
-      
-      Lighthouse Performance Context (only mention if scores are notably poor <60% or exceptional >95%):
-      ${data.lighthouse ? formatLighthouseMetrics(data.lighthouse) : 'No lighthouse data available'}
-      
-      PAGE ROLE ANALYSIS:
-      - Considering this is a ${data.page_type || 'webpage'}, how completely does it fulfill its specific purpose in advancing ${context.org_purpose}?
-      - What essential information or functionality is missing that users would expect on this type of page?
-      - How effectively does this page connect users to logical next steps in their journey?
-      - Does the content demonstrate value and build trust appropriate for this stage of user engagement?
-      `;
-      
-      pagePrompt += getExampleSection();
-      return pagePrompt;
+      return getPagePromptPrefix() + createPageDetails(data, context);
 
     default:
       return 'Please analyze the provided website data and screenshots focusing on content completeness, user value, and organizational goal achievement.';
@@ -328,9 +457,16 @@ function formatLighthouseMetrics(lighthouse) {
 }
 
 module.exports = {
+  DEFAULT_ORG_CONTEXT,
+  SCORING_RUBRIC,
   getAnalysisPrompt,
+  getPagePromptBlocks,
   getScoringDefinitions,
   getExampleSection,
   createAnalysisPrompt,
+  createStaticAnalysisPrompt,
+  createContextBlock,
+  getPagePromptPrefix,
+  getPagePromptDigest,
   formatLighthouseMetrics
 };
\ No newline at end of file
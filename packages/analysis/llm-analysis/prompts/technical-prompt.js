@@ -1,24 +1,23 @@
-function getScoringDefinitions() {
-    return `
-      SCORING RUBRIC:
-      1-3: Poor - Significantly hinders user experience and requires immediate attention
-      4-5: Below Average - Has notable issues affecting effectiveness
-      6-7: Average - Functional but with clear opportunities for improvement
-      8-9: Good - Effectively supports goals with minor refinements needed
-      10: Excellent - Exemplary implementation with no significant issues
+const { SCORING_RUBRIC } = require('./analysis-prompt');
+
+const SCORING_DEFINITIONS = `${SCORING_RUBRIC}
     `;
-  }
-  
-  function getTechnicalPrompt(type, data) {
-    const basePrompt = `You are a technical UX/UI expert conducting a detailed technical analysis.
+
+// Shared opening of every technical prompt, built once at load
+const BASE_PROMPT = `You are a technical UX/UI expert conducting a detailed technical analysis.
     
-    ${getScoringDefinitions()}
+    ${SCORING_DEFINITIONS}
     
     Provide a comprehensive technical assessment focusing on measurable metrics and actionable insights.\n\n`;
+
+function getScoringDefinitions() {
+    return SCORING_DEFINITIONS;
+  }
   
+  function getTechnicalPrompt(type, data) {
     switch (type) {
       case 'summary':
-        return basePrompt + `Generate a technical summary of website performance based on Lighthouse data:
+        return BASE_PROMPT + `Generate a technical summary of website performance based on Lighthouse data:
   
         ${data.lighthouseData.map(page => `
         Page: ${page.url}
@@ -45,7 +44,7 @@ function getScoringDefinitions() {
         Format as a technical report with metrics and specific recommendations.`;
   
       case 'detailed':
-        return basePrompt + `Provide a detailed technical analysis of the website's performance:
+        return BASE_PROMPT + `Provide a detailed technical analysis of the website's performance:
   
         Data summary:
         - Total pages analyzed: ${data.lighthouseData.length}
@@ -84,7 +83,7 @@ function getScoringDefinitions() {
         Provide specific, actionable recommendations with implementation details.`;
   
       case 'architecture':
-        return basePrompt + `Analyze the technical architecture of this website:
+        return BASE_PROMPT + `Analyze the technical architecture of this website:
   
         Performance data across ${data.lighthouseData.length} pages:
         ${data.lighthouseData.map(page => formatArchitectureData(page)).join('\n')}
@@ -117,7 +116,7 @@ function getScoringDefinitions() {
         Provide recommendations for architectural improvements with complexity estimates.`;
   
       case 'critical_issues':
-        return basePrompt + `Identify and prioritize critical technical issues:
+        return BASE_PROMPT + `Identify and prioritize critical technical issues:
   
         Technical data for ${data.lighthouseData.length} pages
         Average performance score: ${calculateAveragePerformance(data.lighthouseData)}%
@@ -147,7 +146,7 @@ function getScoringDefinitions() {
         - Effort: [Time estimate]`;
   
       default:
-        return basePrompt + 'Please provide a technical analysis of the website data.';
+        return BASE_PROMPT + 'Please provide a technical analysis of the website data.';
     }
   }
   
@@ -1,7 +1,31 @@
 const fs = require('fs-extra');
 const path = require('path');
+const crypto = require('crypto');
 const sharp = require('sharp');
 
+// Prepared images are cached next to the screenshots so repeated analyses of
+// the same capture skip the resize/compress/base64 work.
+const IMAGE_CACHE_DIR = '.llm-image-cache';
+// Entries unused for this long are pruned (e.g. screenshots that were deleted)
+const IMAGE_CACHE_MAX_AGE_MS = 30 * 24 * 60 * 60 * 1000; // 30 days
+// Cache directories this process has already pruned
+const prunedImageCacheDirs = new Set();
+
+// Rough characters-per-token ratio for English prompt text
+const CHARS_PER_TOKEN = 4;
+
+// Accepted severity / impact levels for issues and recommendations
+const PRIORITY_LEVELS = new Set(['High', 'Medium', 'Low']);
+
+/**
+ * Checks that a value is a numeric score on the 1-10 scale
+ * @param {*} value - Candidate score
+ * @returns {boolean} True if the score is usable
+ */
+function isValidScore(value) {
+  return typeof value === 'number' && value >= 1 && value <= 10;
+}
+
 /**
  * Validates and cleans up structured data from LLM.
  * 
@@ -25,7 +49,7 @@ function validateStructuredData(data) {
     for (let i = 0; i < data.scores.length; i++) {
       const score = data.scores[i];
       if (!score.category) score.category = `Unnamed Category ${i + 1}`;
-      if (typeof score.score !== 'number' || score.score < 1 || score.score > 10) {
+      if (!isValidScore(score.score)) {
         errors.push(`Score ${i} has invalid value: ${score.score}`);
         score.score = 5;
       }
@@ -39,9 +63,9 @@ function validateStructuredData(data) {
       const issue = data.critical_issues[i];
       if (!issue.id) issue.id = i + 1;
       if (!issue.title) issue.title = `Issue ${i + 1}`;
-      if (!['High', 'Medium', 'Low'].includes(issue.severity)) {
-        issue.severity = 'Medium';
+      if (!PRIORITY_LEVELS.has(issue.severity)) {
         errors.push(`Issue ${i} has invalid severity: ${issue.severity}`);
+        issue.severity = 'Medium';
       }
       if (!issue.description) issue.description = 'No description provided';
       if (!issue.area) issue.area = 'General';
@@ -54,9 +78,9 @@ function validateStructuredData(data) {
       const rec = data.recommendations[i];
       if (!rec.id) rec.id = i + 1;
       if (!rec.title) rec.title = `Recommendation ${i + 1}`;
-      if (!['High', 'Medium', 'Low'].includes(rec.impact)) {
-        rec.impact = 'Medium';
+      if (!PRIORITY_LEVELS.has(rec.impact)) {
         errors.push(`Recommendation ${i} has invalid impact: ${rec.impact}`);
+        rec.impact = 'Medium';
       }
       if (!rec.description) rec.description = 'No description provided';
       if (!rec.area) rec.area = 'General';
@@ -66,9 +90,7 @@ function validateStructuredData(data) {
   // Validate summary
   if (data.summary) {
     if (!data.summary.text) data.summary.text = 'No summary provided';
-    if (typeof data.summary.overall_score !== 'number' || 
-        data.summary.overall_score < 1 || 
-        data.summary.overall_score > 10) {
+    if (!isValidScore(data.summary.overall_score)) {
       errors.push(`Overall score has invalid value: ${data.summary.overall_score}`);
       data.summary.overall_score = 5;
     }
@@ -85,11 +107,120 @@ function validateStructuredData(data) {
 }
 
 /**
- * Prepares an image for LLM analysis, resizing and compressing as needed
+ * Builds the cache file path for a prepared image. There is one entry per
+ * screenshot path, so a recapture overwrites its entry instead of leaving a stale one.
+ * @param {string} imagePath - Path to the image file
+ * @returns {string} Path of the cache entry
+ */
+function getImageCachePath(imagePath) {
+  const digest = crypto.createHash('sha256').update(path.resolve(imagePath)).digest('hex').substring(0, 32);
+  return path.join(path.dirname(imagePath), IMAGE_CACHE_DIR, `${digest}.json`);
+}
+
+/**
+ * Identifies the version of a screenshot a cache entry was prepared from
+ * @param {fs.Stats} stats - Stats of the image file
+ * @returns {string} Source identity
+ */
+function getImageCacheSource(stats) {
+  return `${stats.mtimeMs}:${stats.size}`;
+}
+
+/**
+ * Reads a cached prepared image, returning null on a miss or when the screenshot has changed
+ * @param {string} cachePath - Path of the cache entry
+ * @param {string} source - Identity of the current screenshot
+ * @returns {Promise<Object|null>} Cached image data or null
+ */
+async function readImageCache(cachePath, source) {
+  try {
+    const entry = await fs.readJson(cachePath);
+    if (!entry || entry.source !== source) return null;
+    // Refresh the entry's mtime so age-based pruning only removes unused entries
+    const now = new Date();
+    await fs.utimes(cachePath, now, now).catch(() => {});
+    return entry.imageData;
+  } catch (error) {
+    return null;
+  }
+}
+
+/**
+ * Writes a prepared image to the cache atomically (write to temp file, then rename)
+ * @param {string} cachePath - Path of the cache entry
+ * @param {string} source - Identity of the screenshot the data was prepared from
+ * @param {Object} imageData - Prepared image data
+ */
+async function writeImageCache(cachePath, source, imageData) {
+  const tempPath = `${cachePath}.${process.pid}.tmp`;
+  try {
+    await fs.ensureDir(path.dirname(cachePath));
+    await fs.writeJson(tempPath, { source, imageData });
+    await fs.rename(tempPath, cachePath);
+  } catch (error) {
+    console.warn(`  ⚠️  Could not cache prepared image ${path.basename(cachePath)}: ${error.message}`);
+    await fs.remove(tempPath).catch(() => {});
+  }
+}
+
+/**
+ * Removes cache entries (and leftover temp files) that have not been used within
+ * IMAGE_CACHE_MAX_AGE_MS. Runs at most once per directory per process.
+ * @param {string} cacheDir - Image cache directory
+ */
+async function pruneImageCache(cacheDir) {
+  if (prunedImageCacheDirs.has(cacheDir)) return;
+  prunedImageCacheDirs.add(cacheDir);
+
+  let entries;
+  try {
+    entries = await fs.readdir(cacheDir);
+  } catch (error) {
+    return; // No cache yet
+  }
+
+  const cutoff = Date.now() - IMAGE_CACHE_MAX_AGE_MS;
+  await Promise.all(entries.map(async (entry) => {
+    const entryPath = path.join(cacheDir, entry);
+    try {
+      const stats = await fs.stat(entryPath);
+      if (stats.isFile() && stats.mtimeMs < cutoff) {
+        await fs.remove(entryPath);
+      }
+    } catch (error) {
+      // Removed concurrently; nothing to prune
+    }
+  }));
+}
+
+/**
+ * Prepares an image for LLM analysis, reusing a cached result when the file is unchanged
  * @param {string} imagePath - Path to the image file
  * @returns {Promise<Object>} Image data formatted for LLM
  */
 async function prepareImageForLLM(imagePath) {
+  const stats = await fs.stat(imagePath);
+  const cachePath = getImageCachePath(imagePath);
+  const source = getImageCacheSource(stats);
+  await pruneImageCache(path.dirname(cachePath));
+
+  const cached = await readImageCache(cachePath, source);
+  if (cached) {
+    console.log(`  ♻️  Using cached image data (${path.basename(imagePath)})`);
+    return cached;
+  }
+
+  const imageData = await processImageForLLM(imagePath);
+  await writeImageCache(cachePath, source, imageData);
+  return imageData;
+}
+
+/**
+ * Resizes and compresses an image for LLM analysis
+ * @param {string} imagePath - Path to the image file
+ * @returns {Promise<Object>} Image data formatted for LLM
+ */
+async function processImageForLLM(imagePath) {
   try {
     // First, get image dimensions
     const metadata = await sharp(imagePath).metadata();
@@ -388,8 +519,19 @@ function extractPageSuggestions(pageAnalysis) {
     .filter(line => line.length > 0);
 }
 
+/**
+ * Estimates the token count of prompt text without calling a tokenizer.
+ * Good enough for a pre-flight budget check, not for billing.
+ * @param {string} text - Prompt text
+ * @returns {number} Estimated token count
+ */
+function estimateTokens(text) {
+  return Math.ceil(text.length / CHARS_PER_TOKEN);
+}
+
 module.exports = {
   prepareImageForLLM,
+  estimateTokens,
   processAnalysisResults,
   calculateAverageScores,
   extractKeyFindings,
@@ -207,12 +207,8 @@ async function processAnalysis(jobId) {
     const { analysisData } = job;
     const screenshots = analysisData.screenshots || [];
     
-    console.log(`📸 Screenshots received: ${screenshots.length}`);
-    console.log(`📸 Screenshot details:`, screenshots.map(s => ({
-      url: s.url,
-      success: s.success,
-      hasData: !!s.data
-    })));
+    const successfulScreenshots = screenshots.filter(s => s.success).length;
+    console.log(`📸 Screenshots received: ${screenshots.length} (${successfulScreenshots} successful)`);
 
     // IMPORTANT: Only process URLs from the screenshots array, not all files in directory
     const urls = screenshots
@@ -19,8 +19,6 @@
 import { useState, useEffect } from "react";
 import Link from "next/link";
 import { useQuery } from "@tanstack/react-query";
-import ReactMarkdown from 'react-markdown';
-import remarkGfm from 'remark-gfm';
 import { Card, CardHeader, CardTitle, CardContent, CardDescription, CardFooter } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
@@ -29,7 +27,7 @@ import { ExternalLink, ChevronRight, Zap, Lightbulb, ListChecks, MapIcon, Palett
 
 // Migrated Components
 import { ExecutiveSummary } from "@/features/reports";
-import { FormattedDate } from "@/components/common";
+import { FormattedDate, MarkdownContent } from "@/components/common";
 
 // --- Interfaces from original Index.tsx ---
 interface PageIssue {
@@ -131,7 +129,7 @@ const MarkdownSectionRenderer: React.FC<{
     <div className="space-y-6">
         {mainContent && mainContent.trim() && (
             <div className="prose prose-lg max-w-none text-slate-700 leading-relaxed">
-                <ReactMarkdown remarkPlugins={[remarkGfm]}>{mainContent}</ReactMarkdown>
+                <MarkdownContent>{mainContent}</MarkdownContent>
             </div>
         )}
         
@@ -144,7 +142,7 @@ const MarkdownSectionRenderer: React.FC<{
                             <h4 className="text-xl font-semibold text-indigo-800">Goal Achievement Assessment</h4>
                         </div>
                         <div className="prose prose-base max-w-none text-indigo-700 leading-relaxed">
-                            <ReactMarkdown remarkPlugins={[remarkGfm]}>{goalAchievementAssessment}</ReactMarkdown>
+                            <MarkdownContent>{goalAchievementAssessment}</MarkdownContent>
                         </div>
                     </div>
                 )}
@@ -161,7 +159,7 @@ const MarkdownSectionRenderer: React.FC<{
                             </AccordionTrigger>
                             <AccordionContent className="pt-4 pb-6 px-6">
                                 <div className="prose prose-base max-w-none text-slate-600 leading-relaxed">
-                                    <ReactMarkdown remarkPlugins={[remarkGfm]}>{sub.content}</ReactMarkdown>
+                                    <MarkdownContent>{sub.content}</MarkdownContent>
                                 </div>
                             </AccordionContent>
                         </AccordionItem>
@@ -184,6 +182,15 @@ const MarkdownSectionRenderer: React.FC<{
     </div>
 );
 
+// Detailed overview sections shown as tabs, keyed by normalized heading.
+// Module-level so the tab effect does not see a new object on every render.
+const SECTION_DETAILS: { [key: string]: { icon: React.ElementType; title: string } } = {
+    'key-findings': { icon: Lightbulb, title: "Key Findings" },
+    'strategic-recommendations': { icon: ListChecks, title: "Strategic Recommendations" },
+    'overall-theme-assessment': { icon: Palette, title: "Overall Theme Assessment" },
+    'implementation-roadmap': { icon: Route, title: "Implementation Roadmap" },
+};
+
 // --- The Main Page Component ---
 export default function ReportOverviewPage({ params }: { params: { reportId: string } }) {
     const { reportId } = params;
@@ -325,27 +332,20 @@ export default function ReportOverviewPage({ params }: { params: { reportId: str
         }
     }, [overallScore]);
 
-    const sectionDetails: { [key: string]: { icon: React.ElementType; title: string } } = {
-        'key-findings': { icon: Lightbulb, title: "Key Findings" },
-        'strategic-recommendations': { icon: ListChecks, title: "Strategic Recommendations" },
-        'overall-theme-assessment': { icon: Palette, title: "Overall Theme Assessment" },
-        'implementation-roadmap': { icon: Route, title: "Implementation Roadmap" },
-    };
-
     useEffect(() => {
-        const availableParsedKeys = Object.keys(parsedDetailedSections).filter(key => key !== 'executive-summary' && sectionDetails[key]);
+        const availableParsedKeys = Object.keys(parsedDetailedSections).filter(key => key !== 'executive-summary' && SECTION_DETAILS[key]);
         
         if (availableParsedKeys.length > 0) {
             if (!availableParsedKeys.includes(activeDetailedTab) || activeDetailedTab === 'executive-summary') {
                 setActiveDetailedTab(availableParsedKeys[0]);
             }
         } else if (Object.keys(parsedDetailedSections).length === 0) {
-            const firstKeyFromDetails = Object.keys(sectionDetails).find(key => key !== 'executive-summary');
-            if (firstKeyFromDetails && activeDetailedTab !== firstKeyFromDetails && sectionDetails[activeDetailedTab] === undefined) {
+            const firstKeyFromDetails = Object.keys(SECTION_DETAILS).find(key => key !== 'executive-summary');
+            if (firstKeyFromDetails && activeDetailedTab !== firstKeyFromDetails && SECTION_DETAILS[activeDetailedTab] === undefined) {
                 setActiveDetailedTab(firstKeyFromDetails);
             }
         }
-    }, [parsedDetailedSections, activeDetailedTab, sectionDetails]);
+    }, [parsedDetailedSections, activeDetailedTab]);
     
     if (isLoading) return <div className="min-h-screen flex items-center justify-center">Loading Report...</div>;
     if (isError) return <div className="min-h-screen flex items-center justify-center">Error: {error.message}</div>;
@@ -412,14 +412,14 @@ export default function ReportOverviewPage({ params }: { params: { reportId: str
                 {/* Detailed tabs section */}
                 <section className="mt-10">
                     <h2 className="text-3xl font-bold text-slate-900 mb-8">Detailed Findings</h2>
-                    {Object.keys(parsedDetailedSections).filter(key => key !== 'executive-summary' && sectionDetails[key]).length > 0 ? (
+                    {Object.keys(parsedDetailedSections).filter(key => key !== 'executive-summary' && SECTION_DETAILS[key]).length > 0 ? (
                         <div className="bg-white rounded-2xl border border-slate-200/80 shadow-xl overflow-hidden">
                             <Tabs value={activeDetailedTab} onValueChange={setActiveDetailedTab} className="w-full">
                                 <div className="border-b border-slate-200 bg-gradient-to-r from-slate-50/90 to-white/90 backdrop-blur-sm px-4 sm:px-6 py-3">
                                     <TabsList className="grid w-full grid-cols-2 sm:flex sm:w-auto bg-transparent p-0 h-auto gap-1 sm:gap-2 justify-start overflow-x-auto scrollbar-hide">
-                                        {Object.keys(sectionDetails).map((key) => {
+                                        {Object.keys(SECTION_DETAILS).map((key) => {
                                             if (key === 'executive-summary') return null;
-                                            const sectionInfo = sectionDetails[key];
+                                            const sectionInfo = SECTION_DETAILS[key];
                                             const Icon = sectionInfo?.icon;
                                             return parsedDetailedSections[key] ? (
                                                 <TabsTrigger
@@ -444,7 +444,7 @@ export default function ReportOverviewPage({ params }: { params: { reportId: str
                                 <div className="p-6 sm:p-8">
                                     {Object.keys(parsedDetailedSections).map((key) => {
                                         if (key === 'executive-summary') return null;
-                                        return parsedDetailedSections[key] && sectionDetails[key] && (
+                                        return parsedDetailedSections[key] && SECTION_DETAILS[key] && (
                                             <TabsContent key={key} value={key} className="mt-0 focus-visible:ring-0 focus-visible:ring-offset-0 outline-none">
                                                 <MarkdownSectionRenderer
                                                     title={parsedDetailedSections[key]!.title}
@@ -452,7 +452,7 @@ export default function ReportOverviewPage({ params }: { params: { reportId: str
                                                     subsections={parsedDetailedSections[key]!.subsections}
                                                     performanceSummary={key === 'key-findings' ? performanceSummary : undefined}
                                                     goalAchievementAssessment={key === 'key-findings' ? goalAchievement : undefined}
-                                                    icon={sectionDetails[key]!.icon}
+                                                    icon={SECTION_DETAILS[key]!.icon}
                                                     sectionKey={key}
                                                 />
                                             </TabsContent>
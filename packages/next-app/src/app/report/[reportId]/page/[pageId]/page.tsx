@@ -19,13 +19,12 @@
 import React, { useState, useEffect, useMemo } from "react";
 import Link from "next/link";
 import { useQuery } from "@tanstack/react-query";
-import ReactMarkdown from 'react-markdown';
-import remarkGfm from 'remark-gfm';
 import { Card, CardHeader, CardTitle, CardContent } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
 import { ExternalLink, FileText, Target as TargetIcon, CheckCircle2, AlertTriangleIcon, Info, Home, ImageOff, MessageSquareHeart } from "lucide-react";
 import { FormattedDate } from "@/components/common/formatted-date";
+import { MarkdownContent } from "@/components/common/markdown-content";
 
 // --- Interfaces and Helper Functions ---
 interface PageIssue {
@@ -170,22 +169,24 @@ const getScoreColorTextClass = (score: number): string => {
   return "text-red-600";
 };
 
+// Line prefixes that open the page role section of a raw analysis
+const PAGE_ROLE_KEYWORDS = ['PAGE ROLE ANALYSIS', 'PAGE ROLE:', 'ROLE OF THIS PAGE:'];
+
 const extractPageRoleAnalysis = (content: string | undefined): string | null => {
   if (!content) return null;
   const lines = content.split('\n');
   let pageRoleContent: string[] = [];
   let inPageRoleSection = false;
-  const pageRoleKeywords = ['PAGE ROLE ANALYSIS', 'PAGE ROLE:', 'ROLE OF THIS PAGE:'];
 
   lines.forEach((line) => {
     const trimmedLine = line.trim();
     const upperLine = trimmedLine.toUpperCase();
-    if (pageRoleKeywords.some(keyword => upperLine.startsWith(keyword))) {
+    if (PAGE_ROLE_KEYWORDS.some(keyword => upperLine.startsWith(keyword))) {
       inPageRoleSection = true;
       const contentAfterKeyword = trimmedLine.substring(upperLine.indexOf(':') + 1).trim();
       if (contentAfterKeyword) pageRoleContent.push(contentAfterKeyword);
     } else if (trimmedLine.startsWith('## ') && inPageRoleSection) {
-      if (!pageRoleKeywords.some(keyword => upperLine.startsWith(keyword))) inPageRoleSection = false;
+      if (!PAGE_ROLE_KEYWORDS.some(keyword => upperLine.startsWith(keyword))) inPageRoleSection = false;
     } else if (inPageRoleSection && trimmedLine && !trimmedLine.toUpperCase().includes('EVIDENCE:')) {
       pageRoleContent.push(trimmedLine);
     }
@@ -194,27 +195,32 @@ const extractPageRoleAnalysis = (content: string | undefined): string | null =>
   return result || null;
 };
 
+// Upper-cased section headings mapped to their section_scores keys
+const SECTION_TITLE_SCORE_KEYS: { [title: string]: string } = {
+  'FIRST IMPRESSION & CLARITY': 'first_impression_clarity',
+  'GOAL ALIGNMENT': 'goal_alignment',
+  'VISUAL DESIGN': 'visual_design',
+  'CONTENT QUALITY': 'content_quality',
+  'USABILITY & ACCESSIBILITY': 'usability_accessibility',
+  'CONVERSION OPTIMIZATION': 'conversion_optimization',
+  'TECHNICAL EXECUTION': 'technical_execution'
+};
+const SECTION_HEADING_REGEX = /^##\s*\d*\.?\s*([^(\n]+)(?:\s*\(Score:\s*(\d+)\/10\))?/i;
+const SCORE_SUFFIX_REGEX = /\(Score:\s*(\d+)\/10\)/i;
+const SCORE_SUFFIX_WITH_SPACE_REGEX = /\s*\(Score:\s*\d+\/10\)/i;
+
 const parseDetailedAnalysisSections = (content: string | undefined, sectionScores: { [key: string]: number } = {}): PageSection[] => {
   if (!content) return [];
   const lines = content.split('\n');
   const parsedSections: PageSection[] = [];
-  const titleToScoreKey: { [key: string]: keyof typeof sectionScores } = {
-    'FIRST IMPRESSION & CLARITY': 'first_impression_clarity',
-    'GOAL ALIGNMENT': 'goal_alignment',
-    'VISUAL DESIGN': 'visual_design',
-    'CONTENT QUALITY': 'content_quality',
-    'USABILITY & ACCESSIBILITY': 'usability_accessibility',
-    'CONVERSION OPTIMIZATION': 'conversion_optimization',
-    'TECHNICAL EXECUTION': 'technical_execution'
-  };
   let currentSectionData: Partial<PageSection> & { contentBuffer?: string[] } = {};
   let collectingEvidence = false;
 
   const finalizeSection = () => {
     if (currentSectionData.title) {
-      const scoreKey = titleToScoreKey[currentSectionData.title.toUpperCase() as keyof typeof titleToScoreKey];
+      const scoreKey = SECTION_TITLE_SCORE_KEYS[currentSectionData.title.toUpperCase()];
       const scoreValue = scoreKey ? sectionScores[scoreKey] : undefined;
-      const sectionRawScoreMatch = currentSectionData.title.match(/\(Score:\s*(\d+)\/10\)/i);
+      const sectionRawScoreMatch = currentSectionData.title.match(SCORE_SUFFIX_REGEX);
       let finalScore = 5; // Default score
 
       if (typeof scoreValue === 'number') {
@@ -226,7 +232,7 @@ const parseDetailedAnalysisSections = (content: string | undefined, sectionScore
       }
       
       // Clean title from score string
-      const cleanTitle = currentSectionData.title.replace(/\s*\(Score:\s*\d+\/10\)/i, '').trim();
+      const cleanTitle = currentSectionData.title.replace(SCORE_SUFFIX_WITH_SPACE_REGEX, '').trim();
 
       parsedSections.push({
         name: currentSectionData.name || cleanTitle.toLowerCase().replace(/[^a-z0-9]+/g, '_'),
@@ -245,7 +251,7 @@ const parseDetailedAnalysisSections = (content: string | undefined, sectionScore
 
   for (const line of lines) {
     const trimmedLine = line.trim();
-    const sectionMatch = trimmedLine.match(/^##\s*\d*\.?\s*([^(\n]+)(?:\s*\(Score:\s*(\d+)\/10\))?/i);
+    const sectionMatch = trimmedLine.match(SECTION_HEADING_REGEX);
 
     if (sectionMatch) {
       finalizeSection();
@@ -307,6 +313,10 @@ export default function PageAnalysisPage({ params }: { params: { reportId: strin
     return [];
   }, [pageData]);
 
+  const pageRoleAnalysis = useMemo(() => {
+    return extractPageRoleAnalysis(pageData?.detailed_analysis || pageData?.raw_analysis);
+  }, [pageData]);
+
   useEffect(() => {
     if (activeTab === "tab-detailed") {
       if (analysisSections.length > 0) {
@@ -523,9 +533,9 @@ export default function PageAnalysisPage({ params }: { params: { reportId: strin
                     <h3 className="text-xl font-bold text-slate-900">Page Role & Purpose</h3>
                   </div>
                   <div className="prose prose-base max-w-none text-slate-700 leading-relaxed">
-                    <ReactMarkdown remarkPlugins={[remarkGfm]}>
-                      {extractPageRoleAnalysis(pageData.detailed_analysis || pageData.raw_analysis) || getGenericPageRoleDescription(pageData)}
-                    </ReactMarkdown>
+                    <MarkdownContent>
+                      {pageRoleAnalysis || getGenericPageRoleDescription(pageData)}
+                    </MarkdownContent>
                   </div>
                 </div>
 
@@ -611,9 +621,9 @@ export default function PageAnalysisPage({ params }: { params: { reportId: strin
                              section.rawContent && (
                               <div>
                                 <h5 className="text-sm font-semibold text-slate-600 uppercase tracking-wider mb-2">Detailed Observations</h5>
-                                <ReactMarkdown remarkPlugins={[remarkGfm]} className="prose prose-sm max-w-none text-slate-700 leading-relaxed">
+                                <MarkdownContent className="prose prose-sm max-w-none text-slate-700 leading-relaxed">
                                   {section.rawContent}
-                                </ReactMarkdown>
+                                </MarkdownContent>
                               </div>
                             )}
                           </div>
@@ -1,4 +1,5 @@
 export { FormattedDate } from './formatted-date';
+export { MarkdownContent } from './markdown-content';
 export { LoadingSpinner } from './loading-spinner';
 export { PageLoading } from './page-loading';
 export { PageError } from './page-error';
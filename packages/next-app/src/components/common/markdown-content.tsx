@@ -0,0 +1,30 @@
+/**
+ * Markdown Content Component - Memoized Markdown Rendering
+ *
+ * Renders analysis markdown with GitHub-flavored extensions. Memoized so
+ * re-renders of a report page (tab switches, score animations) do not
+ * re-parse markdown whose text has not changed.
+ *
+ * @responsibilities
+ * - Renders markdown text with remark-gfm
+ * - Skips re-parsing when the text and class name are unchanged
+ */
+
+"use client";
+
+import { memo } from 'react';
+import ReactMarkdown from 'react-markdown';
+import remarkGfm from 'remark-gfm';
+
+// Shared plugin list; a new array on every render would defeat the memo
+const REMARK_PLUGINS = [remarkGfm];
+
+interface MarkdownContentProps {
+  children: string;
+  className?: string;
+}
+
+export const MarkdownContent = memo(function MarkdownContent({ children, className }: MarkdownContentProps) {
+  const markdown = <ReactMarkdown remarkPlugins={REMARK_PLUGINS}>{children}</ReactMarkdown>;
+  return className ? <div className={className}>{markdown}</div> : markdown;
+});